@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Any
+from typing import List, Any, Tuple
 
 
 class EventEmitter():
@@ -24,6 +24,20 @@ class EventEmitter():
         self.__event_names = []
         self.__event_handlers = {}
 
+    @property
+    def event_names(self) -> List[str]:
+        """
+        The event names.
+
+        Built on `get_event_names` and `set_event_names`, so subclasses that
+        override those methods (e.g. to delegate to a wrapped emitter) are honored.
+        """
+        return self.get_event_names()
+
+    @event_names.setter
+    def event_names(self, event_names: List[str]) -> None:
+        self.set_event_names(event_names)
+
     def set_event_names(self, event_names: List[str]) -> None:
         """
         Sets the event names.
@@ -42,7 +56,7 @@ class EventEmitter():
         """
         return self.__event_names
 
-    def get_event_handlers(self, event_name: str) -> List[callable]:
+    def get_event_handlers(self, event_name: str) -> Tuple[callable, ...]:
         """
         Gets the event handlers.
 
@@ -50,12 +64,9 @@ class EventEmitter():
         event_name (str): The event name.
 
         # Returns
-        List[callable]: The event handlers.
+        Tuple[callable, ...]: The event handlers.
         """
-        if event_name not in self.__event_handlers:
-            return []
-
-        return self.__event_handlers[event_name]
+        return self.__event_handlers.get(event_name, ())
 
     def on(self, event_name: str, handler: callable) -> None:
         """
@@ -68,10 +79,10 @@ class EventEmitter():
         if event_name not in self.__event_names:
             raise Exception(f"Event name '{event_name}' is not valid.")
 
-        if event_name not in self.__event_handlers:
-            self.__event_handlers[event_name] = []
-
-        self.__event_handlers[event_name].append(handler)
+        # Handlers are replaced rather than mutated so that emit() can iterate
+        # over them while handlers are being added
+        self.__event_handlers[event_name] = \
+            self.__event_handlers.get(event_name, ()) + (handler,)
 
     def off(self, event_name: str) -> None:
         """
@@ -97,8 +108,13 @@ class EventEmitter():
         *args (list): The arguments.
         **kwargs (dict): The keyword arguments.
         """
-        if event_name not in self.__event_handlers:
+        handlers = self.__event_handlers.get(event_name)
+        if not handlers:
             return
 
-        for handler in self.__event_handlers[event_name]:
-            handler(*args, **kwargs)
+        if kwargs:
+            for handler in handlers:
+                handler(*args, **kwargs)
+        else:
+            for handler in handlers:
+                handler(*args)
@@ -20,7 +20,7 @@ from typing import Any, Iterable
 from darcyai.input.input_stream import InputStream
 from darcyai.input.video_stream_data import VideoStreamData
 from darcyai.log import setup_custom_logger
-from darcyai.utils import validate_not_none, timestamp
+from darcyai.utils import validate_not_none, validate_type, validate, timestamp
 
 
 class CameraStream(InputStream):
@@ -34,6 +34,9 @@ class CameraStream(InputStream):
     video_height (int): The height of the video frames. Defaults to `480`.
     flip_frames (bool): Whether or not to flip the video frames. Defaults to `False`.
     fps (int): The frames per second to stream. Defaults to `30`.
+    video_fourcc (str): The FOURCC code of the pixel format to request from the camera,
+        e.g. `"MJPG"` to have USB cameras send JPEG compressed frames. Not used with the
+        Raspberry Pi camera. Defaults to `None`, which keeps the camera's default format.
 
     # Examples
     ```python
@@ -49,19 +52,25 @@ class CameraStream(InputStream):
                  video_width: int = 640,
                  video_height: int = 480,
                  flip_frames: bool = False,
-                 fps: int = 30):
+                 fps: int = 30,
+                 video_fourcc: str = None):
         super().__init__()
 
         if not use_pi_camera:
             validate_not_none(video_device, "video_device is required")
 
+        if video_fourcc is not None:
+            validate_type(video_fourcc, str, "video_fourcc must be a string")
+            validate(len(video_fourcc) == 4, "video_fourcc must be 4 characters long")
+
         self.__use_pi_camera = use_pi_camera
         self.__video_device = video_device
         self.__frame_width = video_width
         self.__frame_height = video_height
         self.__flip_frames = flip_frames
         self.__fps = fps
-        self.__last_frame_timestamp = 0
+        self.__video_fourcc = video_fourcc
+        self.__last_frame_time = 0
 
         self.__vs = None
         self.__stopped = True
@@ -117,17 +126,19 @@ class CameraStream(InputStream):
 
         self.__stopped = False
 
-        delay = int(1000 / self.__fps)
+        # Frames are paced with the monotonic clock so that wall clock adjustments
+        # don't stall or speed up the stream
+        delay = 1 / self.__fps
         while not self.__stopped:
             if self.__stopped:
                 break
 
-            time.sleep(max(0, (delay - (timestamp() - self.__last_frame_timestamp)) / 1000))
+            time.sleep(max(0, delay - (time.monotonic() - self.__last_frame_time)))
 
             frame = self.__read_frame(self.__vs)
-            self.__last_frame_timestamp = timestamp()
+            self.__last_frame_time = time.monotonic()
 
-            yield VideoStreamData(frame, self.__last_frame_timestamp)
+            yield VideoStreamData(frame, timestamp())
 
     @staticmethod
     def get_video_inputs():
@@ -174,9 +185,15 @@ class CameraStream(InputStream):
                 framerate=self.__fps).start()
         else:
             vs = cv2.VideoCapture(self.__video_device)
+            # The pixel format is set first as it limits the sizes and frame rates available
+            if self.__video_fourcc is not None:
+                vs.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.__video_fourcc))
             vs.set(cv2.CAP_PROP_FRAME_WIDTH, self.__frame_width)
             vs.set(cv2.CAP_PROP_FRAME_HEIGHT, self.__frame_height)
             vs.set(cv2.CAP_PROP_FPS, self.__fps)
+            # Keep a single frame in the driver's queue so that frames don't pile up
+            # when the pipeline falls behind and each read gets the latest frame
+            vs.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         test_frame = self.__read_frame(vs)
         counter = 0
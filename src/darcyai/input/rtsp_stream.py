@@ -51,7 +51,9 @@ class RTSPStream(InputStream):
 
         self.__vs = None
         self.__stopped = True
+        # Only the latest frame is kept, older frames are dropped when the pipeline falls behind
         self.__frame = deque(maxlen=1)
+        self.__frame_ready = threading.Event()
         self.__read = threading.Thread(target=self.__get_frame)
 
     def stop(self) -> None:
@@ -66,6 +68,7 @@ class RTSPStream(InputStream):
         ```
         """
         self.__stopped = True
+        self.__frame_ready.set()
 
         if self.__vs is None:
             return
@@ -89,11 +92,15 @@ class RTSPStream(InputStream):
         self.__read.start()
 
         while not self.__stopped:
+            # Wait for the reader thread instead of polling the frame buffer in a busy loop
+            self.__frame_ready.wait()
+            self.__frame_ready.clear()
             try:
                 frame = self.__frame.pop()
-                yield (VideoStreamData(frame, timestamp()))
             except IndexError:
-                pass
+                continue
+
+            yield (VideoStreamData(frame, timestamp()))
 
         self.__vs.release()
         self.__vs = None
@@ -122,6 +129,7 @@ class RTSPStream(InputStream):
                 frame = self.__overlay(
                     self.__bars, "Unable to read from the RTSP stream")
             self.__frame.append(frame)
+            self.__frame_ready.set()
 
     def __overlay(self, frame, text, font_scale=0.5, color=(255, 255, 255), thinkness=2):
         cv2.putText(frame.copy(), text, (20, 20), cv2.FONT_HERSHEY_SIMPLEX,
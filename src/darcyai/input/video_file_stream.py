@@ -101,7 +101,7 @@ class VideoFileStream(InputStream):
         if not self.__process_all_frames:
             self.__rate = self.__vs.get(cv2.CAP_PROP_FPS)
             self.__delay = int(1000 / self.__rate)
-            self.__last_frame_timestamp = None
+            self.__last_frame_time = None
 
         self.__stopped = False
 
@@ -140,11 +140,12 @@ class VideoFileStream(InputStream):
             return False, None
 
         if not self.__process_all_frames:
-            if self.__last_frame_timestamp is None:
-                self.__last_frame_timestamp = timestamp()
+            # Frames are paced with the monotonic clock, in milliseconds like the delay
+            if self.__last_frame_time is None:
+                self.__last_frame_time = time.monotonic() * 1000
             else:
-                now = timestamp()
-                diff = now - self.__last_frame_timestamp
+                now = time.monotonic() * 1000
+                diff = now - self.__last_frame_time
                 if diff < self.__delay:
                     time.sleep((self.__delay - diff) / 1000)
                 else:
@@ -157,7 +158,7 @@ class VideoFileStream(InputStream):
 
                     self.__vs.set(cv2.CAP_PROP_POS_FRAMES, self.__frame_number)
 
-                self.__last_frame_timestamp = now
+                self.__last_frame_time = now
 
         success, frame = self.__vs.read()
 
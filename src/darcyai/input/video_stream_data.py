@@ -22,6 +22,8 @@ class VideoStreamData(StreamData):
     """
     StreamData representation of video frames
     """
+    __slots__ = ()
+
     def serialize(self) -> dict:
         """
         Serialize the data to a dict
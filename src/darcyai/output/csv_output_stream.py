@@ -67,10 +67,12 @@ class CSVOutputStream(OutputStream):
             buffer_size=buffer_size,
             flush_interval=flush_interval)
 
-        self.__delimiter = delimiter
-        self.__quotechar = quotechar
-        self.__delimiter = delimiter
-        self.__quotechar = quotechar
+        # Rows are formatted into the same in-memory buffer for every write
+        self.__output = io.StringIO()
+        self.__csv_writer = csv.writer(
+            self.__output,
+            delimiter=delimiter,
+            quotechar=quotechar)
 
         self.set_config_schema([])
 
@@ -97,15 +99,11 @@ class CSVOutputStream(OutputStream):
 
         validate_type(data, list, "data must be a list")
 
-        output = io.StringIO()
-        csv_writer = csv.writer(
-            output,
-            delimiter=self.__delimiter,
-            quotechar=self.__quotechar)
+        self.__output.seek(0)
+        self.__output.truncate()
+        self.__csv_writer.writerow(data)
 
-        csv_writer.writerow(data)
-
-        self.__file_stream.write_string(output.getvalue())
+        self.__file_stream.write_string(self.__output.getvalue())
 
     def close(self) -> None:
         """
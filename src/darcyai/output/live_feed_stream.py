@@ -26,6 +26,19 @@ from darcyai.output.output_stream import OutputStream
 from darcyai.config import Config
 from darcyai.utils import validate_not_none, validate_type, validate
 
+# Number of reusable frame buffers: one being encoded, one waiting to be encoded
+# and one that the next frame is written to
+FRAME_BUFFER_COUNT = 3
+
+# Bounds and steps of the adaptive JPEG quality used when `quality_target_ms` is set
+MIN_ADAPTIVE_QUALITY = 40
+QUALITY_DECREASE_STEP = 5
+QUALITY_INCREASE_STEP = 2
+# Number of consecutive frames over the encoding budget before the quality is lowered
+FRAMES_OVER_BUDGET_LIMIT = 3
+# The quality is raised again when encoding takes less than this fraction of the budget
+UNDER_BUDGET_RATIO = 0.7
+
 
 class LiveFeedStream(OutputStream):
     """
@@ -38,6 +51,10 @@ class LiveFeedStream(OutputStream):
     host (str): Host to host the live stream. Defaults to `None`.
     fps (int): Frames per second to stream. Defaults to `20`.
     quality (int): Quality of the JPEG encoding. Defaults to `100`.
+    quality_target_ms (float): Time budget in milliseconds for encoding a frame.
+        When set, the JPEG quality is lowered while encoding takes longer than
+        the budget and raised back up to `quality` once it is well under it.
+        Defaults to `None`, which always encodes with `quality`.
 
     # Examples
     ```python
@@ -56,6 +73,7 @@ class LiveFeedStream(OutputStream):
                  host: str = None,
                  fps: int = 20,
                  quality: int = 100,
+                 quality_target_ms: float = None,
                  **kwargs):
         super().__init__(**kwargs)
 
@@ -80,17 +98,35 @@ class LiveFeedStream(OutputStream):
 
         self.__validate_quality(quality)
 
+        if quality_target_ms is not None:
+            validate_type(quality_target_ms, (int, float), "quality_target_ms must be a number")
+            validate(quality_target_ms > 0, "quality_target_ms must be greater than 0")
+
         self.__flask_app = flask_app
         self.__port = port
         self.__path = path
 
         self.__fps = fps
         self.__quality = quality
+        self.__quality_target_ms = quality_target_ms
+        self.__encode_quality = quality
+        self.__frames_over_budget = 0
 
         self.__latest_frame = None
+        self.__encoding_frame = None
+        self.__frame_buffers = []
+        self.__frame_lock = threading.Lock()
         self.__encoded_frame = None
         self.__logger = setup_custom_logger(__name__)
 
+        # Frames are JPEG encoded in a background thread so that the encoding doesn't hold up
+        # the pipeline. Only the latest frame is encoded, older frames are dropped.
+        # Frames are copied into reusable buffers, since the caller may reuse its own buffer
+        # for the next frame while this one is still waiting to be encoded
+        self.__frame_ready = threading.Event()
+        self.__encoder_thread = None
+        self.__closed = False
+
         threading.Thread(target=self.__start_api_server).start()
 
         self.set_config_schema([
@@ -112,11 +148,16 @@ class LiveFeedStream(OutputStream):
         """
         Write a frame to the stream.
 
+        The frame is JPEG encoded in a background thread, so the returned JPEG
+        is the most recently encoded frame, which can be an earlier frame than
+        the one that was just written.
+
         # Arguments
         data (Any): Frame to write.
 
         # Returns
-        Any: The annotated frame.
+        Any: The most recently encoded frame in JPEG format, or `None`
+            until the first frame has been encoded.
 
         # Examples
         ```python
@@ -131,27 +172,31 @@ class LiveFeedStream(OutputStream):
         if data is None:
             return
 
-        show_timestamp = self.get_config_value("show_timestamp")
-        if not show_timestamp:
-            frame_copy = data
-        else:
-            frame_copy = data.copy()
+        with self.__frame_lock:
+            frame = self.__get_free_frame_buffer(data)
+            np.copyto(frame, data)
 
-            timestamp_format = self.get_config_value("timestamp_format")
-            timestamp = datetime.now()
-            ts = timestamp.strftime(timestamp_format)
+            show_timestamp = self.get_config_value("show_timestamp")
+            if show_timestamp:
+                timestamp_format = self.get_config_value("timestamp_format")
+                timestamp = datetime.now()
+                ts = timestamp.strftime(timestamp_format)
 
-            ts_x = 0
-            ts_y = 0
-            (_, _), stamp_baseline = cv2.getTextSize(
-                ts, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)
-            ts_y = int(data.shape[0] - stamp_baseline)
+                ts_x = 0
+                ts_y = 0
+                (_, _), stamp_baseline = cv2.getTextSize(
+                    ts, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)
+                ts_y = int(data.shape[0] - stamp_baseline)
 
-            cv2.putText(frame_copy, ts, (ts_x, ts_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1, cv2.LINE_AA)
+                cv2.putText(frame, ts, (ts_x, ts_y),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1, cv2.LINE_AA)
 
-        self.__latest_frame = frame_copy
-        self.__encoded_frame = self.__encode_jpeg(frame_copy)
+            self.__latest_frame = frame
+
+        if self.__encoder_thread is None:
+            self.__encoder_thread = threading.Thread(target=self.__encode_frames, daemon=True)
+            self.__encoder_thread.start()
+        self.__frame_ready.set()
 
         return self.__encoded_frame
 
@@ -236,6 +281,7 @@ class LiveFeedStream(OutputStream):
         self.__validate_quality(quality)
 
         self.__quality = quality
+        self.__encode_quality = quality
 
     def close(self) -> None:
         """
@@ -251,7 +297,8 @@ class LiveFeedStream(OutputStream):
         >>> live_feed_stream.close()
         ```
         """
-        pass
+        self.__closed = True
+        self.__frame_ready.set()
 
     def get_latest_frame(self) -> Any:
         """
@@ -310,7 +357,7 @@ class LiveFeedStream(OutputStream):
         """
         while True:
             try:
-                while self.__latest_frame is None:
+                while self.__encoded_frame is None:
                     time.sleep(0.10)
                     continue
 
@@ -337,6 +384,51 @@ class LiveFeedStream(OutputStream):
 
         return response
 
+    def __encode_frames(self) -> None:
+        """
+        Encodes the latest frame as JPEG whenever a new frame is written.
+        """
+        while not self.__closed:
+            self.__frame_ready.wait()
+            self.__frame_ready.clear()
+
+            with self.__frame_lock:
+                frame = self.__latest_frame
+                self.__latest_frame = None
+                if frame is not None:
+                    self.__encoding_frame = frame
+
+            if frame is None or self.__closed:
+                continue
+
+            try:
+                start = time.perf_counter_ns()
+                self.__encoded_frame = self.__encode_jpeg(frame)
+                if self.__quality_target_ms is not None:
+                    self.__adapt_quality((time.perf_counter_ns() - start) / 1e6)
+            except Exception:
+                self.__logger.exception("Error at encoding frame")
+
+    def __get_free_frame_buffer(self, data) -> Any:
+        """
+        Get a frame buffer that is neither waiting to be encoded nor being encoded.
+        The buffers are (re)allocated when the frame size or type changes.
+
+        # Arguments
+        data (numpy.ndarray): Frame that is going to be copied into the buffer.
+
+        # Returns
+        numpy.ndarray: Frame buffer.
+        """
+        if len(self.__frame_buffers) == 0 or \
+                self.__frame_buffers[0].shape != data.shape or \
+                self.__frame_buffers[0].dtype != data.dtype:
+            self.__frame_buffers = [np.empty_like(data) for _ in range(FRAME_BUFFER_COUNT)]
+
+        return next(
+            frame for frame in self.__frame_buffers
+            if frame is not self.__latest_frame and frame is not self.__encoding_frame)
+
     def __encode_jpeg(self, frame) -> bytes:
         """
         Encode a frame as JPEG.
@@ -347,7 +439,27 @@ class LiveFeedStream(OutputStream):
         # Returns
         bytes: Encoded JPEG.
         """
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), self.__quality]
+        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), self.__encode_quality]
         img_encode = cv2.imencode(".jpg", frame, encode_param)[1]
-        data_encode = np.array(img_encode)
-        return data_encode.tobytes()
+        return img_encode.tobytes()
+
+    def __adapt_quality(self, elapsed_ms: float) -> None:
+        """
+        Adjust the JPEG quality to the time it took to encode the last frame.
+
+        # Arguments
+        elapsed_ms (float): Time it took to encode the last frame in milliseconds.
+        """
+        if elapsed_ms > self.__quality_target_ms:
+            self.__frames_over_budget += 1
+            if self.__frames_over_budget >= FRAMES_OVER_BUDGET_LIMIT:
+                self.__frames_over_budget = 0
+                min_quality = min(MIN_ADAPTIVE_QUALITY, self.__quality)
+                self.__encode_quality = max(
+                    self.__encode_quality - QUALITY_DECREASE_STEP, min_quality)
+            return
+
+        self.__frames_over_budget = 0
+        if elapsed_ms < self.__quality_target_ms * UNDER_BUDGET_RATIO:
+            self.__encode_quality = min(
+                self.__encode_quality + QUALITY_INCREASE_STEP, self.__quality)
@@ -15,9 +15,20 @@
 import importlib.util
 from typing import Union
 
+from darcyai.log import setup_custom_logger
 from darcyai.perceptor.perceptor import Perceptor
 from darcyai.utils import validate_type, validate, import_module
 
+# Ops that are expected to run on the CPU next to a model compiled for the Edge TPU.
+# Anything else means the Edge TPU compiler could not map part of the model.
+EDGETPU_CPU_OPS = frozenset([
+    "edgetpu-custom-op",
+    "QUANTIZE",
+    "DEQUANTIZE",
+    "TFLite_Detection_PostProcess",
+    "PosenetDecoderOp",
+])
+
 class CoralPerceptorBase(Perceptor):
     """
     Base class for all Coral Perceptors.
@@ -30,6 +41,8 @@ class CoralPerceptorBase(Perceptor):
         if len(edge_tpus) == 0:
             raise RuntimeError("No Coral Edge TPUs found")
 
+        self.__logger = setup_custom_logger(__name__)
+
     def load(self, accelerator_idx: Union[int, None] = None) -> None:
         """
         Loads the perceptor.
@@ -54,6 +67,33 @@ class CoralPerceptorBase(Perceptor):
 
         self.interpreter.allocate_tensors()
 
+        # The first inference copies the model's parameters to the Edge TPU, so run it
+        # on the zeroed input here instead of stalling the pipeline's first frame
+        self.interpreter.invoke()
+        self.__warn_on_cpu_fallback_ops()
+
+    def __warn_on_cpu_fallback_ops(self) -> None:
+        """
+        Logs a warning when the model has ops that the Edge TPU compiler did not map
+        to the Edge TPU, since they run on the CPU and make the inference time jitter.
+        """
+        # _get_ops_details() is only available in newer TensorFlow Lite runtimes
+        get_ops_details = getattr(self.interpreter, "_get_ops_details", None)
+        if not callable(get_ops_details):
+            return
+
+        ops_details = get_ops_details()
+        if not isinstance(ops_details, list):
+            return
+
+        fallback_ops = sorted({
+            op["op_name"] for op in ops_details if op["op_name"] not in EDGETPU_CPU_OPS})
+        if len(fallback_ops) > 0:
+            self.__logger.warning(
+                "%s has ops that run on the CPU instead of the Edge TPU: %s",
+                self.model_path,
+                ", ".join(fallback_ops))
+
     @staticmethod
     def list_edge_tpus() -> list:
         """
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import cv2
 import importlib.util
+import numpy as np
+from typing import Any
 
 from darcyai.perceptor.perceptor import Perceptor
 from darcyai.utils import import_module, validate_not_none, validate_type, validate
@@ -44,8 +47,27 @@ class CpuPerceptorBase(Perceptor):
         self.interpreter = \
             self.__tf_interpreter(model_path=self.model_path, num_threads=self.__num_cpu_threads)
         self.interpreter.allocate_tensors()
+        self.__input_index = self.interpreter.get_input_details()[0]["index"]
         super().set_loaded(True)
 
+    def set_resized_input(self, input_data:Any) -> None:
+        """
+        Resizes the input data to the model's input size, writing it straight into
+        the interpreter's input tensor instead of copying it in with `set_tensor`.
+
+        # Arguments
+        input_data (Any): The input image.
+        """
+        input_tensor = self.interpreter.tensor(self.__input_index)()[0]
+        height, width = input_tensor.shape[:2]
+        resized_input = cv2.resize(input_data, (width, height), dst=input_tensor)
+        if resized_input is not input_tensor:
+            # OpenCV allocates a new image when the input tensor's type doesn't match the
+            # input data, so let set_tensor validate it. The interpreter can't be invoked
+            # while a view into its tensors is still referenced
+            del input_tensor
+            self.interpreter.set_tensor(self.__input_index, resized_input[np.newaxis])
+
     @staticmethod
     def read_label_file(filename:str, has_ids:bool=True, encoding:str="UTF-8") -> dict:
         """
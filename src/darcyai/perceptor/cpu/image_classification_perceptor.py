@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import collections
-import cv2
 import operator
 import numpy as np
 from typing import Any, List
@@ -75,7 +74,6 @@ class ImageClassificationPerceptor(CpuPerceptorBase):
         self.__threshold = threshold
         self.__top_k = top_k
         self.__quantized = quantized
-        self.__input_details = None
 
 
     def run(self, input_data:Any, config:ConfigRegistry=None) -> List[Class]:
@@ -89,12 +87,7 @@ class ImageClassificationPerceptor(CpuPerceptorBase):
         # Returns
         (list[Any], list(str)): A tuple containing the detected classes and the labels.
         """
-        resized_input = cv2.resize(
-            input_data, (self.__input_details[0]["shape"][1], self.__input_details[0]["shape"][2]))
-        resized_input = resized_input.reshape(
-            [1, self.__input_details[0]["shape"][1], self.__input_details[0]["shape"][2], 3])
-
-        self.interpreter.set_tensor(self.__input_details[0]["index"], resized_input)
+        self.set_resized_input(input_data)
         self.interpreter.invoke()
 
         scores = self.interpreter.get_tensor(self.__output_details[0]["index"])[0]
@@ -131,5 +124,4 @@ class ImageClassificationPerceptor(CpuPerceptorBase):
         accelerator_idx (int): Not used.
         """
         CpuPerceptorBase.load(self)
-        self.__input_details = self.interpreter.get_input_details()
         self.__output_details = self.interpreter.get_output_details()
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cv2
 from typing import Any, List
 
 from darcyai.config_registry import ConfigRegistry
@@ -65,7 +64,6 @@ class ObjectDetectionPerceptor(CpuPerceptorBase):
         self.interpreter = None
         self.__threshold = threshold
         self.__quantized = quantized
-        self.__input_details = None
         self.__output_details = None
 
     def run(self, input_data:Any, config:ConfigRegistry=None) -> List[Object]:
@@ -80,12 +78,7 @@ class ObjectDetectionPerceptor(CpuPerceptorBase):
         (list[Any], list(str)): A tuple containing the detected objects and the labels.
         """
 
-        resized_input = cv2.resize(
-            input_data, (self.__input_details[0]["shape"][1], self.__input_details[0]["shape"][2]))
-        resized_input = resized_input.reshape(
-            [1, self.__input_details[0]["shape"][1], self.__input_details[0]["shape"][2], 3])
-
-        self.interpreter.set_tensor(self.__input_details[0]["index"], resized_input)
+        self.set_resized_input(input_data)
         self.interpreter.invoke()
 
         det_boxes = self.interpreter.get_tensor(self.__output_details[0]["index"])[0]
@@ -125,7 +118,6 @@ class ObjectDetectionPerceptor(CpuPerceptorBase):
         accelerator_idx (int): Not used.
         """
         CpuPerceptorBase.load(self)
-        self.__input_details = self.interpreter.get_input_details()
         self.__output_details = self.interpreter.get_output_details()
 
     def __scale(self, input_shape, bbox):
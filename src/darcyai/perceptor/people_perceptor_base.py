@@ -139,6 +139,7 @@ class PoseEngine():
         self._input_details = self._interpreter.get_input_details()
         self._output_details = self._interpreter.get_output_details()
         self._inf_time = 0
+        self._resized_image = None
         self.__tpu = tpu and not self.__is_windows
         self.__minimum_pose_threshold = minimum_pose_threshold
 
@@ -169,21 +170,25 @@ class PoseEngine():
             return self.DetectPosesInImageWindows(input_image)
         
         input_image_shape = input_image.shape
-        resized_image = cv2.resize(input_image, (self._input_width, self._input_height))
+        # Resize into the same buffer on every frame instead of allocating a new image
+        self._resized_image = cv2.resize(input_image,
+                                         (self._input_width, self._input_height),
+                                         dst=self._resized_image)
+        resized_image = self._resized_image
         assert (resized_image.shape == tuple(self._input_tensor_shape[1:]))
 
-        input_data = np.expand_dims(resized_image, axis=0)
         if self._input_type is np.float32:
             # Floating point versions of posenet take image data in [-1,1] range.
             input_data = np.float32(resized_image) / 128.0 - 1.0
         else:
             # Assuming to be uint8
-            input_data = np.asarray(resized_image)
+            input_data = resized_image
 
         if not self.__tpu:
             input_data = np.expand_dims(input_data, axis=0)
         else:
-            input_data = input_data.flatten()
+            # The resized image is contiguous, so this is a view rather than a copy
+            input_data = input_data.ravel()
     
         self.run_inference(input_data)
     
@@ -434,7 +439,7 @@ class PeoplePerceptorBase(Perceptor):
         self.__mark_unmatched_body_ids_as_missing(self.__frame_number, config)
 
         #Check if a new POI has been determined
-        if self.__poi != None and ('person_id' in self.__poi) and self.__poi['person_id'] != 0:
+        if self.__poi is not None and ('person_id' in self.__poi) and self.__poi['person_id'] != 0:
             if self.__prior_poi_id != self.__poi['person_id']:
                 self.__set_person_as_poi(self.__poi['person_id'], self.__frame_number, self.__poi, config)
 
@@ -36,6 +36,8 @@ class PerceptorNode:
     multi (bool): Whether or not to run the perceptor for each item in
         input data. Defaults to `False`.
     accelerator_idx (int): The index of the Edge TPU to use. Defaults to `None`.
+    load (bool): Whether or not to load the perceptor right away. When `False`,
+        `load()` must be called before running the perceptor. Defaults to `True`.
 
     # Examples
     ```python
@@ -60,7 +62,8 @@ class PerceptorNode:
                                             PerceptionObjectModel],
                                            Any] = None,
                  multi: bool = False,
-                 accelerator_idx: Union[int, None] = None):
+                 accelerator_idx: Union[int, None] = None,
+                 load: bool = True):
         validate_not_none(perceptor, "perceptor is required")
         validate_type(
             perceptor,
@@ -94,7 +97,24 @@ class PerceptorNode:
 
         self.__logger = setup_custom_logger(f"{__name__}.{perceptor_name}")
 
-        self.__perceptor.load(accelerator_idx)
+        if load:
+            self.load()
+
+    def load(self) -> None:
+        """
+        Loads the perceptor on its accelerator.
+
+        # Examples
+        ```python
+        >>> from darcyai.perceptor.perceptor_node import PerceptorNode
+        >>> perceptor_node = PerceptorNode(perceptor_name="perceptor_name",
+        ...                                perceptor=perceptor,
+        ...                                accelerator_idx=0,
+        ...                                load=False)
+        >>> perceptor_node.load()
+        ```
+        """
+        self.__perceptor.load(self.accelerator_idx)
 
     def add_child_perceptor(self, perceptor_name: str) -> None:
         """
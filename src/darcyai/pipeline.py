@@ -19,14 +19,13 @@ import platform
 import sys
 import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from collections.abc import Iterable
 from flask import Flask, request, Response, jsonify, render_template
 from json import JSONEncoder
 from multiprocessing.pool import ThreadPool
 from signal import SIGABRT, SIGILL, SIGINT, SIGSEGV, SIGTERM, signal
 from typing import Callable, Any, Dict, Tuple, Union, List
-from unittest.mock import sentinel
 from waitress import serve
 
 from darcyai.config import Config, RGB
@@ -43,6 +42,8 @@ from darcyai.processing_engine import ProcessingEngine
 from darcyai.stream_data import StreamData
 from darcyai.utils import validate_not_none, validate_type, validate
 
+_END_OF_ITERATION = object()
+
 
 class Pipeline():
     """
@@ -188,11 +189,9 @@ class Pipeline():
 
         self.__num_of_edge_tpus = num_of_edge_tpus
 
-        self.__input_data_history_len = input_data_history_len
-        self.__input_data_history = OrderedDict()
+        self.__input_data_history = deque(maxlen=input_data_history_len)
 
-        self.__pom_history_len = pom_history_len
-        self.__pom_history = OrderedDict()
+        self.__pom_history = deque(maxlen=pom_history_len)
 
         self.__metrics_history = OrderedDict()
         self.__metrics_history_len = metrics_history_len
@@ -274,7 +273,8 @@ class Pipeline():
         perceptor (Perceptor): The Perceptor to be added.
         input_callback (Callable[[StreamData, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor receives input data.
-            Defaults to `None`.
+            Defaults to `None`, which passes the input data to the Perceptor as is
+            without calling into a callback.
         output_callback (Callable[[Any, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor produces output data.
             Defaults to `None`.
@@ -303,34 +303,86 @@ class Pipeline():
         ...                        default_config={"key": "value"})
         ```
         """
-        self.__logger.debug("Adding Perceptor '%s' to Pipeline", name)
-
-        self.__validate_perceptor(
-            name=name,
-            perceptor=perceptor,
+        self.__add_perceptor(
+            name,
+            perceptor,
             input_callback=input_callback,
             output_callback=output_callback,
+            parent=parent,
+            multi=multi,
             accelerator_idx=accelerator_idx,
             default_config=default_config)
 
-        if parent is not None and parent not in self.__perceptors:
-            raise ValueError(
-                f"perceptor with name '{parent}' does not exist")
+    def add_perceptors(self, perceptors: List[Dict[str, Any]]) -> None:
+        """
+        Adds several Perceptors to the pipeline at once.
 
-        perceptor_node = PerceptorNode(
-            name,
-            perceptor,
-            input_callback,
-            output_callback,
-            multi,
-            accelerator_idx)
+        Each item holds the keyword arguments of `add_perceptor`. The Perceptors are
+        added in topological order, so children can be listed before their parents.
+        Once they are all added, the Perceptors on different accelerators are loaded in parallel.
+        If any of them fails to be added or loaded, none of them is kept in the pipeline.
 
-        self.__perceptors[name] = perceptor_node
-        if parent is not None:
-            self.__perceptors[parent].add_child_perceptor(name)
+        # Arguments
+        perceptors (List[Dict[str, Any]]): The Perceptors to be added.
 
-        self.__create_config_registry_for_perceptor(
-            name, perceptor, default_config)
+        # Examples
+        ```python
+        >>> from darcyai.input.camera_stream import CameraStream
+        >>> from darcyai.pipeline import Pipeline
+
+        >>> camera = CameraStream(video_device="/dev/video0")
+        >>> pipeline = Pipeline(input_stream=camera)
+        >>> pipeline.add_perceptors([
+        ...     {"name": "child", "perceptor": MyPerceptor(), "parent": "perceptor"},
+        ...     {"name": "perceptor", "perceptor": MyPerceptor()},
+        ... ])
+        ```
+        """
+        validate_not_none(perceptors, "perceptors is required")
+        validate_type(perceptors, list, "perceptors must be a list")
+
+        names = set()
+        for perceptor in perceptors:
+            validate_type(perceptor, dict, "perceptors must be a list of dictionaries")
+            names.add(perceptor.get("name"))
+
+        # Kahn's algorithm: start with the Perceptors whose parent is not part of this batch
+        children = {}
+        ready = deque()
+        for perceptor in perceptors:
+            parent = perceptor.get("parent")
+            if parent in names:
+                children.setdefault(parent, []).append(perceptor)
+            else:
+                ready.append(perceptor)
+
+        ordered_perceptors = []
+        while len(ready) > 0:
+            perceptor = ready.popleft()
+            ordered_perceptors.append(perceptor)
+            ready.extend(children.pop(perceptor.get("name"), []))
+
+        if len(children) > 0:
+            remaining = [child.get("name") for batch in children.values() for child in batch]
+            raise ValueError(f"perceptors {remaining} have a cyclic parent dependency")
+
+        # Perceptors are loaded once the whole graph is built: one thread per accelerator,
+        # loading the Perceptors that share an accelerator one after another
+        existing_perceptors = set(self.__perceptors)
+        try:
+            perceptor_nodes_by_accelerator = {}
+            for perceptor in ordered_perceptors:
+                perceptor_node = self.__add_perceptor(**perceptor, load=False)
+                perceptor_nodes_by_accelerator.setdefault(
+                    perceptor_node.accelerator_idx, []).append(perceptor_node)
+
+            self.__thread_pool.map(
+                self.__load_perceptor_nodes, perceptor_nodes_by_accelerator.values())
+        except Exception:
+            for name in list(self.__perceptors):
+                if name not in existing_perceptors:
+                    self.__remove_perceptor(name)
+            raise
 
     def add_perceptor_before(self,
                              name_to_insert_before: str,
@@ -357,7 +409,8 @@ class Pipeline():
         perceptor (Perceptor): The Perceptor to be added.
         input_callback (Callable[[StreamData, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor receives input data.
-            Defaults to `None`.
+            Defaults to `None`, which passes the input data to the Perceptor as is
+            without calling into a callback.
         output_callback (Callable[[Any, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor produces output data.
             Defaults to `None`.
@@ -454,7 +507,8 @@ class Pipeline():
         perceptor (Perceptor): The Perceptor to be added.
         input_callback (Callable[[StreamData, PerceptionObjectModel, Any], ConfigRegistry]): The
             callback function to be called when the Perceptor receives input data.
-            Defaults to `None`.
+            Defaults to `None`, which passes the input data to the Perceptor as is
+            without calling into a callback.
         output_callback (Callable[[Any, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor produces output data.
             Defaults to `None`.
@@ -517,7 +571,8 @@ class Pipeline():
         perceptor (Perceptor): The Perceptor to be added.
         input_callback (Callable[[StreamData, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor receives input data.
-            Defaults to `None`.
+            Defaults to `None`, which passes the input data to the Perceptor as is
+            without calling into a callback.
         output_callback (Callable[[Any, PerceptionObjectModel, ConfigRegistry], Any]): The
             callback function to be called when the Perceptor produces output data.
             Defaults to `None`.
@@ -741,7 +796,7 @@ class Pipeline():
 
         self.__running = True
 
-        pipeline_start_time = time.time()
+        pipeline_start_time = time.perf_counter()
         pps = 0
 
         stream = self.__input_stream.stream()
@@ -753,9 +808,9 @@ class Pipeline():
             while True:
                 start = time.perf_counter()
                 try:
-                    input_data = next(stream, sentinel.END_OF_ITERATION)
+                    input_data = next(stream, _END_OF_ITERATION)
 
-                    if input_data is sentinel.END_OF_ITERATION:
+                    if input_data is _END_OF_ITERATION:
                         return
                 except Exception as e:
                     self.__logger.exception("Error running Pipeline")
@@ -767,9 +822,7 @@ class Pipeline():
                 self.__pulse_number += 1
 
                 # Store input data history
-                self.__input_data_history[self.__pulse_number] = input_data
-                if len(self.__input_data_history) > self.__input_data_history_len:
-                    self.__input_data_history.popitem(last=False)
+                self.__input_data_history.append((self.__pulse_number, input_data))
 
                 pom = PerceptionObjectModel()
 
@@ -787,7 +840,7 @@ class Pipeline():
                     _ = [async_call.get() for async_call in async_calls]
 
                 pulse_execution_time = time.perf_counter() - start
-                pps = int(self.__pulse_number / (time.time() - pipeline_start_time))
+                pps = int(self.__pulse_number / (time.perf_counter() - pipeline_start_time))
 
                 # Calculate metrics
                 if self.__pulse_number == 1:
@@ -812,9 +865,7 @@ class Pipeline():
                 self.__pom = pom
 
                 # Store pom history
-                self.__pom_history[self.__pulse_number] = self.__pom
-                if len(self.__pom_history) > self.__pom_history_len:
-                    self.__pom_history.popitem(last=False)
+                self.__pom_history.append((self.__pulse_number, self.__pom))
 
                 if self.__perception_completion_callback is not None:
                     self.__perception_completion_callback(pom)
@@ -892,7 +943,7 @@ class Pipeline():
         >>> latest_input = pipeline.get_latest_input()
         ```
         """
-        return self.__input_data_history[self.__pulse_number]
+        return self.__get_from_history(self.__input_data_history, self.__pulse_number)
 
     def get_historical_input(self, pulse_number: int) -> StreamData:
         """
@@ -914,10 +965,7 @@ class Pipeline():
         >>> historical_input = pipeline.get_historical_input(pulse_number=1)
         ```
         """
-        if pulse_number in self.__input_data_history:
-            return self.__input_data_history[pulse_number]
-        else:
-            return None
+        return self.__get_from_history(self.__input_data_history, pulse_number)
 
     def get_input_history(self) -> Dict[int, StreamData]:
         """
@@ -936,7 +984,7 @@ class Pipeline():
         >>> input_history = pipeline.get_input_history()
         ```
         """
-        return self.__input_data_history.copy()
+        return dict(self.__input_data_history)
 
     def get_historical_pom(self, pulse_number: int) -> PerceptionObjectModel:
         """
@@ -958,10 +1006,7 @@ class Pipeline():
         >>> historical_pom = pipeline.get_historical_pom(pulse_number=1)
         ```
         """
-        if pulse_number in self.__pom_history:
-            return self.__pom_history[pulse_number]
-        else:
-            return None
+        return self.__get_from_history(self.__pom_history, pulse_number)
 
     def get_pom_history(self) -> Dict[int, PerceptionObjectModel]:
         """
@@ -980,7 +1025,7 @@ class Pipeline():
         >>> pom_history = pipeline.get_pom_history()
         ```
         """
-        return self.__pom_history.copy()
+        return dict(self.__pom_history)
 
     def run_perceptor(
             self,
@@ -1172,7 +1217,6 @@ class Pipeline():
         if perceptor_name in self.__perceptor_config_registry:
             self.__validate_and_set_value_for_perceptor_config(
                 perceptor_name, name, value)
-            self.__perceptors[perceptor_name].set_perceptor_config(name, value)
         else:
             raise Exception(
                 f"Perceptor with name '{perceptor_name}' not found")
@@ -1359,6 +1403,34 @@ class Pipeline():
 
         return set_result
 
+    @staticmethod
+    def __get_from_history(history: deque, pulse_number: int) -> Any:
+        """
+        Gets the item stored for the given pulse number from a history deque.
+
+        # Arguments
+        history (deque): The history, holding `(pulse_number, item)` tuples
+            for consecutive pulses.
+        pulse_number (int): The pulse number.
+
+        # Returns
+        Any: The item, or `None` if the pulse is not in the history.
+        """
+        try:
+            idx = pulse_number - history[0][0]
+            if idx < 0:
+                return None
+
+            entry = history[idx]
+        except IndexError:
+            return None
+
+        # The oldest entry may have been evicted between the two lookups
+        if entry[0] != pulse_number:
+            return None
+
+        return entry[1]
+
     def __get_perceptors_order(self) -> List[str]:
         """
         Gets the topological order of the perceptors.
@@ -1390,6 +1462,102 @@ class Pipeline():
 
         return perceptors_order
 
+    def __add_perceptor(self,
+                        name: str,
+                        perceptor: Perceptor,
+                        *,
+                        input_callback: Callable[[StreamData,
+                                                  PerceptionObjectModel,
+                                                  ConfigRegistry],
+                                                 Any] = None,
+                        output_callback: Callable[[Any,
+                                                   PerceptionObjectModel,
+                                                   ConfigRegistry],
+                                                  Any] = None,
+                        parent: str = None,
+                        multi: bool = False,
+                        accelerator_idx: int = 0,
+                        default_config: Dict[str, Any] = None,
+                        load: bool = True) -> PerceptorNode:
+        """
+        Adds a new Perceptor to the pipeline.
+
+        # Arguments
+        name (str): The name of the Perceptor.
+        perceptor (Perceptor): The Perceptor to be added.
+        input_callback (Callable[[StreamData, PerceptionObjectModel, ConfigRegistry], Any]): The
+            callback function for the input data. Defaults to `None`.
+        output_callback (Callable[[Any, PerceptionObjectModel, ConfigRegistry], Any]): The
+            callback function for the output data. Defaults to `None`.
+        parent (str): The name of the parent Perceptor. Defaults to `None`.
+        multi (bool): Whether or not to run the perceptor for each item in input data.
+            Defaults to `False`.
+        accelerator_idx (int): The index of the Edge TPU. Defaults to `0`.
+        default_config (Dict[str, Any]): The default config. Defaults to `None`.
+        load (bool): Whether or not to load the Perceptor right away. Defaults to `True`.
+
+        # Returns
+        PerceptorNode: The node of the added Perceptor.
+        """
+        self.__logger.debug("Adding Perceptor '%s' to Pipeline", name)
+
+        self.__validate_perceptor(
+            name=name,
+            perceptor=perceptor,
+            input_callback=input_callback,
+            output_callback=output_callback,
+            accelerator_idx=accelerator_idx,
+            default_config=default_config)
+
+        if parent is not None and parent not in self.__perceptors:
+            raise ValueError(
+                f"perceptor with name '{parent}' does not exist")
+
+        perceptor_node = PerceptorNode(
+            name,
+            perceptor,
+            input_callback,
+            output_callback,
+            multi,
+            accelerator_idx,
+            load)
+
+        self.__perceptors[name] = perceptor_node
+        if parent is not None:
+            self.__perceptors[parent].add_child_perceptor(name)
+
+        self.__create_config_registry_for_perceptor(
+            name, perceptor, default_config)
+
+        return perceptor_node
+
+    def __remove_perceptor(self, name: str) -> None:
+        """
+        Removes a Perceptor that was added to the pipeline.
+
+        # Arguments
+        name (str): The name of the Perceptor.
+        """
+        self.__logger.debug("Removing Perceptor '%s' from Pipeline", name)
+
+        del self.__perceptors[name]
+        for perceptor_node in self.__perceptors.values():
+            perceptor_node.remove_child_perceptor(name)
+
+        self.__perceptor_config_registry.pop(name, None)
+        self.__perceptor_config_schema.pop(name, None)
+
+    @staticmethod
+    def __load_perceptor_nodes(perceptor_nodes: List[PerceptorNode]) -> None:
+        """
+        Loads the Perceptors one after another.
+
+        # Arguments
+        perceptor_nodes (List[PerceptorNode]): The nodes of the Perceptors to be loaded.
+        """
+        for perceptor_node in perceptor_nodes:
+            perceptor_node.load()
+
     def __validate_perceptor(self,
                              name: str,
                              perceptor: Perceptor,
@@ -18,6 +18,7 @@ class Serializable:
     """
     Base class for all serializable objects.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -25,6 +25,7 @@ class StreamData(Serializable):
     data (Any): The data to be stored.
     timestamp (int): The timestamp of the data.
     """
+    __slots__ = ("data", "timestamp")
 
     def __init__(self, data: Any, timestamp: int):
         super().__init__()
@@ -0,0 +1,32 @@
+# Copyright 2022 Edgeworx, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class CallbackMock:
+    """
+    Lightweight stand-in for `Mock` when a test only needs to record calls.
+    """
+    def __init__(self):
+        self.call_args_list = []
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append((args, kwargs))
+
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.call_args_list == [(args, kwargs)], \
+            f"Expected one call with {(args, kwargs)}, got {self.call_args_list}"
@@ -21,10 +21,16 @@ from darcyai.stream_data import StreamData
 class InputStreamMock(InputStream):
     """
     This class is used to mock the input stream.
+
+    # Arguments
+        iter (Iterable): Values to be yielded as stream data.
+        mock (Mock): Mock object to be used for testing.
+        sleep (float): Sleep time in seconds between items.
     """
-    def __init__(self, iter, mock=None):
+    def __init__(self, iter, mock=None, sleep=.1):
         self.__iter = iter
         self.__mock = mock
+        self.__sleep = sleep
 
     def stop(self):
         if self.__mock is not None:
@@ -35,4 +41,4 @@ class InputStreamMock(InputStream):
             if self.__mock is not None:
                 self.__mock.stream(i)
             yield(StreamData(i, int(time.time() * 1000)))
-            time.sleep(.1)
+            time.sleep(self.__sleep)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import cv2
 import numpy as np
 import pytest
 from collections.abc import Iterable
@@ -122,3 +123,22 @@ class TestCameraStream:
             _ = next(stream)
 
         assert "Could not initialize video stream" in str(context.value)
+
+    def test_init_validates_video_fourcc_length(self):
+        with pytest.raises(Exception) as context:
+            CameraStream(video_device="/dev/video0", video_fourcc="MJPEG")
+
+        assert "video_fourcc must be 4 characters long" in str(context.value)
+
+    @patch("darcyai.input.camera_stream.cv2.VideoCapture")
+    def test_stream_sets_video_fourcc(self, video_capture_mock):
+        capture_mock = MagicMock()
+        capture_mock.isOpened.return_value = True
+        capture_mock.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        video_capture_mock.return_value = capture_mock
+
+        camera_stream = CameraStream(video_device="/dev/video0", video_fourcc="MJPG")
+        next(camera_stream.stream())
+
+        capture_mock.set.assert_any_call(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import cv2
+import numpy as np
 import pytest
+import time
 from flask import Flask
 
 from darcyai.output.live_feed_stream import LiveFeedStream
@@ -100,6 +103,18 @@ class TestLiveFeedStream:
 
         assert "quality must be between 0 and 100" in str(context.value)
 
+    def test_constructor_validates_quality_target_ms_type(self):
+        with pytest.raises(Exception) as context:
+            LiveFeedStream(port=1, host="localhost", path="/", quality_target_ms="1")
+
+        assert "quality_target_ms must be a number" in str(context.value)
+
+    def test_constructor_validates_quality_target_ms_range(self):
+        with pytest.raises(Exception) as context:
+            LiveFeedStream(port=1, host="localhost", path="/", quality_target_ms=0)
+
+        assert "quality_target_ms must be greater than 0" in str(context.value)
+
     def test_set_fps_validates_fps_type(self):
         flask_app = Flask(__name__)
         stream = LiveFeedStream(
@@ -191,3 +206,41 @@ class TestLiveFeedStream:
             flask_app=flask_app,
             quality=10)
         assert stream.get_quality() == 10
+
+    def test_write_encodes_latest_frame_in_background(self):
+        flask_app = Flask(__name__)
+        stream = LiveFeedStream(
+            port=1,
+            host="localhost",
+            path="/",
+            flask_app=flask_app)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+        stream.write(frame)
+
+        deadline = time.monotonic() + 5
+        while stream.get_latest_frame() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        encoded_frame = stream.write(frame)
+        stream.close()
+
+        assert encoded_frame is stream.get_latest_frame()
+        assert isinstance(encoded_frame, bytes)
+        decoded_frame = cv2.imdecode(np.frombuffer(encoded_frame, np.uint8), cv2.IMREAD_COLOR)
+        assert decoded_frame.shape == frame.shape
+
+    def test_write_does_not_change_written_frame(self):
+        flask_app = Flask(__name__)
+        stream = LiveFeedStream(
+            port=1,
+            host="localhost",
+            path="/",
+            flask_app=flask_app)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+        for _ in range(5):
+            stream.write(frame)
+        stream.close()
+
+        assert not frame.any()
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 import pytest
+from contextlib import ExitStack
 from unittest.mock import Mock, patch
 
+pytest.importorskip("pycoral.utils.edgetpu")
+
+# pylint: disable=wrong-import-position
 from darcyai.perceptor.coral.object_detection_perceptor import ObjectDetectionPerceptor
 
 
-@pytest.mark.skip(reason="Fix coral dependency")
 class TestObjectDetectionPerceptor:
     """
     Tests for the ObjectDetectionPerceptor class.
@@ -26,102 +29,65 @@ class TestObjectDetectionPerceptor:
     def test_init_happy_path(self):
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
             perceptor = ObjectDetectionPerceptor(threshold=0.5, model_path="model.tflite")
 
         assert perceptor is not None
 
 
-    def test_constructor_fails_if_threshold_is_none(self):
-        mock_list_edge_tpus = Mock()
-        mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with pytest.raises(Exception) as context:
-                ObjectDetectionPerceptor(threshold=None, model_path="model.tflite")
-
-        assert "threshold is required" in str(context.value)
-
-
-    def test_constructor_fails_if_threshold_is_not_a_number(self):
-        mock_list_edge_tpus = Mock()
-        mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with pytest.raises(Exception) as context:
-                ObjectDetectionPerceptor(threshold="0.5", model_path="model.tflite")
-
-        assert "threshold must be a number" in str(context.value)
-
-
-    def test_constructor_fails_if_threshold_is_out_of_range(self):
-        mock_list_edge_tpus = Mock()
-        mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with pytest.raises(Exception) as context:
-                ObjectDetectionPerceptor(threshold=1.1, model_path="model.tflite")
-
-        assert "threshold must be between 0 and 1" in str(context.value)
-
-
-    def test_constructor_fails_if_model_path_is_none(self):
+    @pytest.mark.parametrize("kwargs,message", [
+        ({"threshold": None, "model_path": "model.tflite"}, "threshold is required"),
+        ({"threshold": "0.5", "model_path": "model.tflite"}, "threshold must be a number"),
+        ({"threshold": 1.1, "model_path": "model.tflite"}, "threshold must be between 0 and 1"),
+        ({"threshold": 0.5, "model_path": None}, "model_path is required"),
+        ({"threshold": 0.5, "model_path": "model.tflite", "labels_file": 1},
+         "labels_file must be a string"),
+    ])
+    def test_constructor_fails_on_invalid_arguments(self, kwargs, message):
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with pytest.raises(Exception) as context:
-                ObjectDetectionPerceptor(threshold=0.5, model_path=None)
-
-        assert "model_path is required" in str(context.value)
-
-
-    def test_constructor_fails_if_labels_file_is_not_string(self):
-        mock_list_edge_tpus = Mock()
-        mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with pytest.raises(Exception) as context:
-                ObjectDetectionPerceptor(threshold=0.5, model_path="model.tflite", labels_file=1)
-
-        assert "labels_file must be a string" in str(context.value)
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+            with pytest.raises(Exception, match=message):
+                ObjectDetectionPerceptor(**kwargs)
 
 
     def test_load_fails_when_accelerator_idx_is_not_number(self):
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
             perceptor = ObjectDetectionPerceptor(threshold=0.5,
                                                 model_path="model.tflite")
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="accelerator_idx must be an integer"):
             perceptor.load(accelerator_idx="1")
 
-        assert "accelerator_idx must be an integer" in str(context.value)
-
 
     def test_load_fails_when_accelerator_idx_is_negative(self):
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
             perceptor = ObjectDetectionPerceptor(threshold=0.5,
                                                 model_path="model.tflite")
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="accelerator_idx must be greater than or equal to 0"):
             perceptor.load(accelerator_idx=-1)
 
-        assert "accelerator_idx must be greater than or equal to 0" in str(context.value)
-
 
     def test_load_calls_make_interpreter_with_correct_args_when_accelerator_idx_is_given(self):
         mock_interpreter = Mock()
         mock_interpreter.get_input_details.return_value = [{"shape": [0, 0, 0]}]
+        mock_interpreter._get_ops_details.return_value = [{"op_name": "edgetpu-custom-op"}]
 
         mock_make_interpreter = Mock()
         mock_make_interpreter.return_value = mock_interpreter
 
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
             perceptor = ObjectDetectionPerceptor(threshold=0.5,
                                                 model_path="model.tflite")
 
-        with patch("darcyai.perceptor.coral.edgetpu.make_interpreter", mock_make_interpreter):
+        with patch("pycoral.utils.edgetpu.make_interpreter", mock_make_interpreter):
             perceptor.load(accelerator_idx=1)
 
         mock_make_interpreter.assert_called_once_with("model.tflite", device=":1")
@@ -130,17 +96,18 @@ class TestObjectDetectionPerceptor:
     def test_load_calls_make_interpreter_with_correct_args_when_accelerator_idx_is_none(self):
         mock_interpreter = Mock()
         mock_interpreter.get_input_details.return_value = [{"shape": [0, 0, 0]}]
+        mock_interpreter._get_ops_details.return_value = [{"op_name": "edgetpu-custom-op"}]
 
         mock_make_interpreter = Mock()
         mock_make_interpreter.return_value = mock_interpreter
 
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
             perceptor = ObjectDetectionPerceptor(threshold=0.5,
                                                 model_path="model.tflite")
 
-        with patch("darcyai.perceptor.coral.edgetpu.make_interpreter", mock_make_interpreter):
+        with patch("pycoral.utils.edgetpu.make_interpreter", mock_make_interpreter):
             perceptor.load(accelerator_idx=None)
 
         mock_make_interpreter.assert_called_once_with("model.tflite")
@@ -149,6 +116,7 @@ class TestObjectDetectionPerceptor:
     def test_load_parses_labels_when_labels_file_provided(self):
         mock_interpreter = Mock()
         mock_interpreter.get_input_details.return_value = [{"shape": [0, 0, 0]}]
+        mock_interpreter._get_ops_details.return_value = [{"op_name": "edgetpu-custom-op"}]
 
         mock_make_interpreter = Mock()
         mock_make_interpreter.return_value = mock_interpreter
@@ -157,11 +125,42 @@ class TestObjectDetectionPerceptor:
 
         mock_list_edge_tpus = Mock()
         mock_list_edge_tpus.return_value = ["a_coral"]
-        with patch("darcyai.perceptor.coral.edgetpu.list_edge_tpus", mock_list_edge_tpus):
-            with patch("darcyai.perceptor.coral.edgetpu.make_interpreter", mock_make_interpreter):
-                with patch("darcyai.perceptor.coral.dataset.read_label_file", mock_dataset):
-                    _ = ObjectDetectionPerceptor(threshold=0.5,
-                                                 model_path="model.tflite",
-                                                 labels_file="labels.txt")
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus))
+            stack.enter_context(
+                patch("pycoral.utils.edgetpu.make_interpreter", mock_make_interpreter))
+            stack.enter_context(
+                patch("pycoral.utils.dataset.read_label_file", mock_dataset))
+            _ = ObjectDetectionPerceptor(threshold=0.5,
+                                         model_path="model.tflite",
+                                         labels_file="labels.txt")
 
         mock_dataset.assert_called_once_with("labels.txt")
+
+
+    def test_load_warns_when_model_has_cpu_fallback_ops(self, caplog):
+        mock_interpreter = Mock()
+        mock_interpreter.get_input_details.return_value = [{"shape": [0, 0, 0]}]
+        mock_interpreter._get_ops_details.return_value = [
+            {"op_name": "edgetpu-custom-op"},
+            {"op_name": "TFLite_Detection_PostProcess"},
+            {"op_name": "CONV_2D"},
+        ]
+
+        mock_make_interpreter = Mock()
+        mock_make_interpreter.return_value = mock_interpreter
+
+        mock_list_edge_tpus = Mock()
+        mock_list_edge_tpus.return_value = ["a_coral"]
+        with patch("pycoral.utils.edgetpu.list_edge_tpus", mock_list_edge_tpus):
+            perceptor = ObjectDetectionPerceptor(threshold=0.5,
+                                                model_path="model.tflite")
+
+        with patch("pycoral.utils.edgetpu.make_interpreter", mock_make_interpreter):
+            perceptor.load(accelerator_idx=None)
+
+        warnings = [record for record in caplog.records if record.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "CONV_2D" in warnings[0].getMessage()
+        assert "TFLite_Detection_PostProcess" not in warnings[0].getMessage()
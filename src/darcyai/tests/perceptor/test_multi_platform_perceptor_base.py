@@ -0,0 +1,46 @@
+# Copyright 2022 Edgeworx, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from darcyai.perceptor.multi_platform_perceptor_base import MultiPlatformPerceptorBase
+from darcyai.perceptor.processor import Processor
+from darcyai.tests.perceptor_mock import PerceptorMock
+
+
+class TestMultiPlatformPerceptorBase:
+    """
+    MultiPlatformPerceptorBase tests.
+    """
+    def __create_perceptor(self):
+        with patch("darcyai.perceptor.multi_platform_perceptor_base.get_perceptor_processor",
+                   return_value=Processor.CPU):
+            perceptor = MultiPlatformPerceptorBase(processor_preference=[Processor.CPU])
+        perceptor.perceptor = PerceptorMock(sleep=0)
+
+        return perceptor
+
+    def test_event_names_reads_wrapped_perceptor(self):
+        perceptor = self.__create_perceptor()
+
+        assert perceptor.event_names == perceptor.perceptor.get_event_names()
+
+    def test_event_names_setter_sets_wrapped_perceptor(self):
+        perceptor = self.__create_perceptor()
+
+        perceptor.event_names = ["event_3"]
+
+        assert perceptor.perceptor.event_names == ["event_3"]
+        perceptor.on("event_3", lambda: None)
+        assert len(perceptor.perceptor.get_event_handlers("event_3")) == 1
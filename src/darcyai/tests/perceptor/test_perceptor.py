@@ -26,11 +26,9 @@ class TestPerceptor:
         assert perceptor is not None
 
     def test_init_throws_when_model_path_is_none(self):
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="model_path is required"):
             _ = Perceptor(model_path=None)
 
-        assert "model_path is required" in str(context.value)
-
     def test_is_loaded_returns_false_when_model_is_not_loaded(self):
         perceptor = Perceptor(model_path="model.tflite")
         assert perceptor.is_loaded() is False
@@ -47,14 +45,10 @@ class TestPerceptor:
 
     def test_set_loaded_throws_when_loaded_is_not_boolean(self):
         perceptor = Perceptor(model_path="model.tflite")
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="loaded must be a boolean"):
             perceptor.set_loaded("not a boolean")
 
-        assert "loaded must be a boolean" in str(context.value)
-
     def test_set_loaded_throws_when_loaded_is_none(self):
         perceptor = Perceptor(model_path="model.tflite")
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="loaded is required"):
             perceptor.set_loaded(None)
-
-        assert "loaded is required" in str(context.value)
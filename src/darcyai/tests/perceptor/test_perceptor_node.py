@@ -21,7 +21,17 @@ from darcyai.perception_object_model import PerceptionObjectModel
 from darcyai.stream_data import StreamData
 
 
-class TestPerceptor:
+@pytest.fixture(scope="module", name="pom")
+def fixture_pom():
+    return PerceptionObjectModel()
+
+
+@pytest.fixture(scope="module", name="stream_data")
+def fixture_stream_data():
+    return StreamData([1, 2, 3], 1)
+
+
+class TestPerceptorNode:
     """
     PerceptorNode tests.
     """
@@ -38,11 +48,24 @@ class TestPerceptor:
 
         assert perceptor_node is not None
 
+    def test_init_does_not_load_perceptor_when_load_is_false(self):
+        perceptor_mock = PerceptorMock(sleep=0)
+
+        perceptor_node = PerceptorNode(
+            "name",
+            perceptor_mock,
+            accelerator_idx=0,
+            load=False)
+        assert not perceptor_mock.is_loaded()
+
+        perceptor_node.load()
+        assert perceptor_mock.is_loaded()
+
     def test_init_fails_when_perceptor_name_is_none(self):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor_name is required"):
             PerceptorNode(
                 None,
                 perceptor_mock,
@@ -50,13 +73,11 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "perceptor_name is required" in str(context.value)
-
     def test_init_fails_when_perceptor_name_is_not_of_type_string(self):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor_name must be a string"):
             PerceptorNode(
                 1,
                 perceptor_mock,
@@ -64,12 +85,10 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "perceptor_name must be a string" in str(context.value)
-
     def test_init_fails_when_perceptor_is_none(self):
         input_callback_mock = Mock()
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor is required"):
             PerceptorNode(
                 "name",
                 None,
@@ -77,12 +96,10 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "perceptor is required" in str(context.value)
-
     def test_init_fails_when_perceptor_is_not_of_type_perceptor(self):
         input_callback_mock = Mock()
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor must be an instance of Perceptor"):
             PerceptorNode(
                 "name",
                 1,
@@ -90,13 +107,10 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "perceptor must be an instance of Perceptor" in str(
-            context.value)
-
     def test_init_fails_when_input_callback_is_not_of_type_function(self):
         perceptor_mock = PerceptorMock(sleep=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="input_callback must be a function"):
             PerceptorNode(
                 "name",
                 perceptor_mock,
@@ -104,13 +118,11 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "input_callback must be a function" in str(context.value)
-
     def test_init_fails_when_output_callback_is_not_of_type_function(self):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="output_callback must be a function"):
             PerceptorNode(
                 "name",
                 perceptor_mock,
@@ -119,8 +131,6 @@ class TestPerceptor:
                 multi=False,
                 accelerator_idx=0)
 
-        assert "output_callback must be a function" in str(context.value)
-
     def test_add_child_perceptor_adds_perceptor_to_children(self):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -162,11 +172,9 @@ class TestPerceptor:
             multi=False,
             accelerator_idx=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor_name is required"):
             perceptor_node.add_child_perceptor(None)
 
-        assert "perceptor_name is required" in str(context.value)
-
     def test_add_child_perceptor_fails_when_perceptor_name_is_not_of_type_string(
             self):
         input_callback_mock = Mock()
@@ -178,11 +186,9 @@ class TestPerceptor:
             multi=False,
             accelerator_idx=0)
 
-        with pytest.raises(Exception) as context:
+        with pytest.raises(Exception, match="perceptor_name must be a string"):
             perceptor_node.add_child_perceptor(1)
 
-        assert "perceptor_name must be a string" in str(context.value)
-
     def test_get_child_perceptors_returns_list_of_child_perceptors(self):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -198,7 +204,7 @@ class TestPerceptor:
 
         assert len(perceptor_node.get_child_perceptors()) == 2
 
-    def test_run_calls_output_callback(self):
+    def test_run_calls_output_callback(self, stream_data, pom):
         input_callback_mock = Mock()
         output_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -211,15 +217,12 @@ class TestPerceptor:
             accelerator_idx=0)
 
         return_value = "Hello!"
-        stream_data = StreamData([1, 2, 3], 1)
-        pom = PerceptionObjectModel()
-
         with patch.object(PerceptorMock, "run", return_value=return_value):
             perceptor_node.run(stream_data, pom)
 
         output_callback_mock.method.assert_called_once_with(return_value, pom)
 
-    def test_run_returns_result_of_output_callback(self):
+    def test_run_returns_result_of_output_callback(self, stream_data, pom):
         input_callback_mock = Mock()
         return_value = "output_callback"
         output_callback_mock = Mock()
@@ -233,12 +236,9 @@ class TestPerceptor:
             multi=False,
             accelerator_idx=0)
 
-        stream_data = StreamData([1, 2, 3], 1)
-        pom = PerceptionObjectModel()
-
         assert perceptor_node.run(stream_data, pom) == return_value
 
-    def test_run_returns_result_of_perceptor(self):
+    def test_run_returns_result_of_perceptor(self, stream_data, pom):
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
         perceptor_node = PerceptorNode(
@@ -249,8 +249,5 @@ class TestPerceptor:
             accelerator_idx=0)
 
         return_value = "perceptor_result"
-        stream_data = StreamData([1, 2, 3], 1)
-        pom = PerceptionObjectModel()
-
         with patch.object(PerceptorMock, "run", return_value=return_value):
             assert perceptor_node.run(stream_data, pom) == return_value
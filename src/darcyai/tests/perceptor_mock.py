@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import time
 from random import random
 
@@ -26,18 +27,27 @@ class PerceptorMock(Perceptor):
     # Arguments
         mock (Mock): Mock object to be used for testing.
         sleep (float): Sleep time in seconds.
+
+    Set `FAST_MODE` to `True` to make `run` return a constant string instead
+    of a numbered one, for tests that do not inspect the result.
     """
+    FAST_MODE = False
+
+    _CONFIG_SCHEMA = [
+        Config("config_1", "Config 1", "str", "", "Config 1 Description"),
+        Config("config_2", "Config 2", "int", 0, "Config 2 Description"),
+        Config("config_3", "Config 3", "bool", False, "Config 3 Description"),
+        Config("config_4", "Config 4", "rgb", RGB(255, 255, 255), "Config 4 Description"),
+    ]
+
+    _EVENT_NAMES = ("event_1", "event_2")
+
     def __init__(self, sleep=None, mock=None, **kwargs):
         super().__init__(model_path="models/p1.tflite", **kwargs)
 
-        self.set_config_schema([
-            Config("config_1", "Config 1", "str", "", "Config 1 Description"),
-            Config("config_2", "Config 2", "int", 0, "Config 2 Description"),
-            Config("config_3", "Config 3", "bool", False, "Config 3 Description"),
-            Config("config_4", "Config 4", "rgb", RGB(255, 255, 255), "Config 4 Description"),
-        ])
+        self.set_config_schema(self._CONFIG_SCHEMA)
 
-        self.set_event_names(["event_1", "event_2"])
+        self.set_event_names(self._EVENT_NAMES)
 
         if sleep is not None:
             self.__sleep = sleep
@@ -46,7 +56,7 @@ class PerceptorMock(Perceptor):
 
         self.__mock = mock
 
-        self.__counter = 0
+        self.__counter = itertools.count(1)
 
     # pylint: disable=unused-argument
     def run(self, input_data, config):
@@ -55,8 +65,10 @@ class PerceptorMock(Perceptor):
 
         time.sleep(self.__sleep)
 
-        self.__counter += 1
-        return f"Hello!!! {self.__counter}"
+        if self.FAST_MODE:
+            return "Hello!!!"
+
+        return f"Hello!!! {next(self.__counter)}"
 
     # pylint: disable=unused-argument
     def load(self, accelerator_idx=None):
@@ -64,6 +76,3 @@ class PerceptorMock(Perceptor):
             self.__mock.load(accelerator_idx=None)
 
         super().set_loaded(True)
-
-    def get_event_names(self):
-        return ["event_1", "event_2"]
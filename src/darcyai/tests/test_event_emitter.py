@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import Mock
-
 from darcyai.event_emitter import EventEmitter
+from darcyai.tests.callback_mock import CallbackMock
 
 
 class TestEventEmitter:
@@ -27,45 +26,53 @@ class TestEventEmitter:
 
     def test_on_adds_listener(self):
         emitter = EventEmitter()
-        emitter.set_event_names(["event_1"])
+        emitter.event_names = ["event_1"]
         emitter.on("event_1", lambda: None)
         assert len(emitter.get_event_handlers("event_1")) == 1
 
     def test_on_adds_multiple_listeners(self):
         emitter = EventEmitter()
-        emitter.set_event_names(["event_1"])
+        emitter.event_names = ["event_1"]
         emitter.on("event_1", lambda: None)
         emitter.on("event_1", lambda: None)
         assert len(emitter.get_event_handlers("event_1")) == 2
 
     def test_off_removes_listeners(self):
         emitter = EventEmitter()
-        emitter.set_event_names(["event_1"])
+        emitter.event_names = ["event_1"]
         emitter.on("event_1", lambda: None)
         emitter.on("event_1", lambda: None)
         emitter.off("event_1")
         assert len(emitter.get_event_handlers("event_1")) == 0
 
-    def test_get_event_names(self):
+    def test_set_event_names_and_get_event_names(self):
         emitter = EventEmitter()
         event_names = ["event_1", "event_2"]
         emitter.set_event_names(event_names)
         assert emitter.get_event_names() == event_names
+        assert emitter.event_names == event_names
+
+    def test_event_names_property(self):
+        emitter = EventEmitter()
+        event_names = ["event_1", "event_2"]
+        emitter.event_names = event_names
+        assert emitter.event_names == event_names
+        assert emitter.get_event_names() == event_names
 
     def test_emit_calls_the_listener(self):
-        callback_mock = Mock()
+        callback_mock = CallbackMock()
         emitter = EventEmitter()
-        emitter.set_event_names(["event_1"])
+        emitter.event_names = ["event_1"]
         emitter.on("event_1", callback_mock)
 
         emitter.emit("event_1", "arg1", "arg2")
         callback_mock.assert_called_once_with("arg1", "arg2")
 
     def test_emit_calls_all_the_listener(self):
-        callback_mock1 = Mock()
-        callback_mock2 = Mock()
+        callback_mock1 = CallbackMock()
+        callback_mock2 = CallbackMock()
         emitter = EventEmitter()
-        emitter.set_event_names(["event_1"])
+        emitter.event_names = ["event_1"]
         emitter.on("event_1", callback_mock1)
         emitter.on("event_1", callback_mock2)
 
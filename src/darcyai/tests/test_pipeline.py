@@ -13,22 +13,29 @@
 # limitations under the License.
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 from darcyai.input.input_stream import InputStream
 from darcyai.perception_object_model import PerceptionObjectModel
 from darcyai.pipeline import Pipeline
 from darcyai.output.output_stream import OutputStream
 from darcyai.stream_data import StreamData
+from darcyai.tests.callback_mock import CallbackMock
 from darcyai.tests.input.input_stream_mock import InputStreamMock
 from darcyai.tests.perceptor_mock import PerceptorMock
 
 
+@pytest.fixture(scope="module", name="input_stream")
+def fixture_input_stream():
+    return InputStream()
+
+
 class TestPipeline:
     """
     Pipeline tests.
     """
-    def test_constructor(self):
-        pipeline = Pipeline(InputStream())
+    def test_constructor(self, input_stream):
+        pipeline = Pipeline(input_stream)
         assert pipeline is not None
 
     def test_constructor_validates_input_stream_not_none(self):
@@ -44,34 +51,34 @@ class TestPipeline:
         assert "input_stream must be an instance of InputStream" in str(
             context.value)
 
-    def test_add_output_stream_validates_name_not_none(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_output_stream_validates_name_not_none(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream(None, None, None)
 
         assert "name is required" in str(context.value)
 
-    def test_add_output_stream_validates_name_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_output_stream_validates_name_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream(1, None, None)
 
         assert "name must be a string" in str(context.value)
 
-    def test_add_output_stream_fails_when_name_is_not_identifier(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_output_stream_fails_when_name_is_not_identifier(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream("not-an-identifier", None, None)
 
         assert "name must be a valid identifier" in str(context.value)
 
-    def test_add_output_stream_fails_when_name_already_exists(self):
+    def test_add_output_stream_fails_when_name_already_exists(self, input_stream):
         callback_mock = Mock()
 
-        pipeline = Pipeline(InputStream())
+        pipeline = Pipeline(input_stream)
         pipeline.add_output_stream("name", callback_mock, OutputStream())
 
         with pytest.raises(Exception) as context:
@@ -80,36 +87,36 @@ class TestPipeline:
         assert "output stream with name 'name' already exists" in str(
             context.value)
 
-    def test_add_output_stream_validates_callback_not_none(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_output_stream_validates_callback_not_none(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream("name", None, None)
 
         assert "callback is required" in str(context.value)
 
-    def test_add_output_stream_validates_callback_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_output_stream_validates_callback_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream("name", 1, None)
 
         assert "callback must be a function" in str(context.value)
 
-    def test_add_output_stream_validates_not_none(self):
+    def test_add_output_stream_validates_not_none(self, input_stream):
         callback_mock = Mock()
 
-        pipeline = Pipeline(InputStream())
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream("name", callback_mock, None)
 
         assert "output_stream is required" in str(context.value)
 
-    def test_add_output_stream_validates_type(self):
+    def test_add_output_stream_validates_type(self, input_stream):
         callback_mock = Mock()
 
-        pipeline = Pipeline(InputStream())
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.add_output_stream("name", callback_mock, 1)
@@ -117,24 +124,24 @@ class TestPipeline:
         assert "output_stream must be an instance of OutputStream" in str(
             context.value)
 
-    def test_remove_output_stream_validates_name_not_none(self):
-        pipeline = Pipeline(InputStream())
+    def test_remove_output_stream_validates_name_not_none(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.remove_output_stream(None)
 
         assert "name is required" in str(context.value)
 
-    def test_remove_output_stream_validates_name_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_remove_output_stream_validates_name_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.remove_output_stream(1)
 
         assert "name must be a string" in str(context.value)
 
-    def test_remove_output_stream_fails_when_name_does_not_exist(self):
-        pipeline = Pipeline(InputStream())
+    def test_remove_output_stream_fails_when_name_does_not_exist(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         with pytest.raises(Exception) as context:
             pipeline.remove_output_stream("name")
@@ -142,16 +149,16 @@ class TestPipeline:
         assert "output stream with name 'name' does not exist" in str(
             context.value)
 
-    def test_num_of_edge_tpus_returns_default_value(self):
-        pipeline = Pipeline(InputStream())
+    def test_num_of_edge_tpus_returns_default_value(self, input_stream):
+        pipeline = Pipeline(input_stream)
         assert pipeline.num_of_edge_tpus() == 1
 
-    def test_num_of_edge_tpus_returns_correct_value(self):
-        pipeline = Pipeline(InputStream(), num_of_edge_tpus=2)
+    def test_num_of_edge_tpus_returns_correct_value(self, input_stream):
+        pipeline = Pipeline(input_stream, num_of_edge_tpus=2)
         assert pipeline.num_of_edge_tpus() == 2
 
-    def test_add_perceptor_validates_name_not_none(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_name_not_none(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -161,8 +168,8 @@ class TestPipeline:
 
         assert "name is required" in str(context.value)
 
-    def test_add_perceptor_validates_name_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_name_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -172,8 +179,8 @@ class TestPipeline:
 
         assert "name must be a string" in str(context.value)
 
-    def test_add_perceptor_stream_fails_when_name_is_not_identifier(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_stream_fails_when_name_is_not_identifier(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         input_callback_mock = Mock()
         perceptor_mock = PerceptorMock(sleep=0)
@@ -186,8 +193,8 @@ class TestPipeline:
 
         assert "name must be a valid identifier" in str(context.value)
 
-    def test_add_perceptor_validates_perceptor_not_none(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_perceptor_not_none(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         input_callback_mock = Mock()
 
@@ -196,8 +203,8 @@ class TestPipeline:
 
         assert "perceptor is required" in str(context.value)
 
-    def test_add_perceptor_validates_perceptor_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_perceptor_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         input_callback_mock = Mock()
 
@@ -207,8 +214,8 @@ class TestPipeline:
         assert "perceptor must be an instance of Perceptor" in str(
             context.value)
 
-    def test_add_perceptor_validates_input_callback_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_input_callback_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         perceptor_mock = PerceptorMock(sleep=0)
 
@@ -217,8 +224,8 @@ class TestPipeline:
 
         assert "input_callback must be a function" in str(context.value)
 
-    def test_add_perceptor_validates_output_callback_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_output_callback_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         perceptor_mock = PerceptorMock(sleep=0)
         input_callback_mock = Mock()
@@ -232,8 +239,8 @@ class TestPipeline:
 
         assert "output_callback must be a function" in str(context.value)
 
-    def test_add_perceptor_validates_accelerator_idx_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_accelerator_idx_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         perceptor_mock = PerceptorMock(sleep=0)
         input_callback_mock = Mock()
@@ -247,8 +254,8 @@ class TestPipeline:
 
         assert "accelerator_idx must be an integer" in str(context.value)
 
-    def test_add_perceptor_validates_accelerator_idx_range(self):
-        pipeline = Pipeline(InputStream(), num_of_edge_tpus=2)
+    def test_add_perceptor_validates_accelerator_idx_range(self, input_stream):
+        pipeline = Pipeline(input_stream, num_of_edge_tpus=2)
 
         perceptor_mock = PerceptorMock(sleep=0)
         input_callback_mock = Mock()
@@ -262,8 +269,8 @@ class TestPipeline:
 
         assert "accelerator_idx must be >= 0 and < 2" in str(context.value)
 
-    def test_add_perceptor_validates_default_config_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_add_perceptor_validates_default_config_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         perceptor_mock = PerceptorMock(sleep=0)
         input_callback_mock = Mock()
@@ -278,8 +285,8 @@ class TestPipeline:
         assert "default_config must be a dictionary" in str(context.value)
 
     def test_add_perceptor_throws_if_parent_is_not_none_and_does_not_exist(
-            self):
-        pipeline = Pipeline(InputStream())
+            self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         perceptor_mock = PerceptorMock(sleep=0)
         input_callback_mock = Mock()
@@ -294,6 +301,71 @@ class TestPipeline:
         assert "perceptor with name 'parent' does not exist" in str(
             context.value)
 
+    def test_add_perceptors_adds_parents_before_children(self, input_stream):
+        pipeline = Pipeline(input_stream)
+
+        pipeline.add_perceptors([
+            {"name": "grandchild", "perceptor": PerceptorMock(sleep=0), "parent": "child"},
+            {"name": "child", "perceptor": PerceptorMock(sleep=0), "parent": "root"},
+            {"name": "root", "perceptor": PerceptorMock(sleep=0)},
+        ])
+
+        assert pipeline.get_graph() == {
+            "root": ["child"],
+            "child": ["grandchild"],
+            "grandchild": [],
+        }
+
+    def test_add_perceptors_loads_perceptors(self):
+        pipeline = Pipeline(InputStream(), num_of_edge_tpus=2)
+
+        perceptors = [PerceptorMock(sleep=0) for _ in range(3)]
+        pipeline.add_perceptors([
+            {"name": "first", "perceptor": perceptors[0], "accelerator_idx": 0},
+            {"name": "second", "perceptor": perceptors[1], "accelerator_idx": 1},
+            {"name": "third", "perceptor": perceptors[2], "parent": "first", "accelerator_idx": 1},
+        ])
+
+        assert all(perceptor.is_loaded() for perceptor in perceptors)
+
+    def test_add_perceptors_throws_on_cyclic_parents(self, input_stream):
+        pipeline = Pipeline(input_stream)
+
+        with pytest.raises(Exception) as context:
+            pipeline.add_perceptors([
+                {"name": "first", "perceptor": PerceptorMock(sleep=0), "parent": "second"},
+                {"name": "second", "perceptor": PerceptorMock(sleep=0), "parent": "first"},
+            ])
+
+        assert "cyclic parent dependency" in str(context.value)
+
+    def test_add_perceptors_removes_batch_when_load_fails(self, input_stream):
+        pipeline = Pipeline(input_stream)
+        pipeline.add_perceptor("existing", PerceptorMock(sleep=0))
+
+        failing_perceptor_mock = Mock()
+        failing_perceptor_mock.load.side_effect = RuntimeError("load failed")
+        with pytest.raises(RuntimeError, match="load failed"):
+            pipeline.add_perceptors([
+                {"name": "first", "perceptor": PerceptorMock(sleep=0), "parent": "existing"},
+                {"name": "second",
+                 "perceptor": PerceptorMock(sleep=0, mock=failing_perceptor_mock),
+                 "parent": "first"},
+            ])
+
+        assert pipeline.get_graph() == {"existing": []}
+
+    def test_set_perceptor_config_converts_rgb_hex_string(self, input_stream):
+        pipeline = Pipeline(input_stream)
+
+        perceptor_mock = PerceptorMock(sleep=0)
+        pipeline.add_perceptor("name", perceptor_mock)
+
+        pipeline.set_perceptor_config("name", "config_4", "#ff0000")
+
+        color = perceptor_mock.get_config_value("config_4")
+        assert (color.red(), color.green(), color.blue()) == (255, 0, 0)
+
     def test_stop_stops_input_stream(self):
         stop_callback_mock = MagicMock()
         input_stream_mock = InputStreamMock(range(10), stop_callback_mock)
@@ -305,7 +377,7 @@ class TestPipeline:
         assert stop_callback_mock.stop.called
 
     def test_run_starts_input_stream(self):
-        callback_mock = MagicMock()
+        callback_mock = SimpleNamespace(stream=CallbackMock(), stop=CallbackMock())
         input_stream_mock = InputStreamMock(range(2), callback_mock)
 
         pipeline = Pipeline(input_stream_mock)
@@ -314,8 +386,8 @@ class TestPipeline:
 
         assert callback_mock.stream.call_count == 2
 
-    def test_get_pom_returns_pom_with_correct_type(self):
-        pipeline = Pipeline(InputStream())
+    def test_get_pom_returns_pom_with_correct_type(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         pom = pipeline.get_pom()
 
@@ -323,7 +395,7 @@ class TestPipeline:
 
     def test_get_current_pulse_number_returns_correct_number(self):
         callback_mock = MagicMock()
-        input_stream_mock = InputStreamMock(range(5), callback_mock)
+        input_stream_mock = InputStreamMock(range(5), callback_mock, sleep=0)
 
         pipeline = Pipeline(input_stream_mock)
 
@@ -333,7 +405,7 @@ class TestPipeline:
 
     def test_get_latest_input_returns_correct_data(self):
         callback_mock = MagicMock()
-        input_stream_mock = InputStreamMock(range(5), callback_mock)
+        input_stream_mock = InputStreamMock(range(5), callback_mock, sleep=0)
 
         pipeline = Pipeline(input_stream_mock)
 
@@ -346,7 +418,7 @@ class TestPipeline:
 
     def test_get_historical_input_returns_correct_data(self):
         callback_mock = MagicMock()
-        input_stream_mock = InputStreamMock(range(5), callback_mock)
+        input_stream_mock = InputStreamMock(range(5), callback_mock, sleep=0)
 
         pipeline = Pipeline(input_stream_mock)
 
@@ -359,7 +431,7 @@ class TestPipeline:
 
     def test_get_historical_input_returns_none_if_index_is_out_of_bounds(self):
         callback_mock = MagicMock()
-        input_stream_mock = InputStreamMock(range(1), callback_mock)
+        input_stream_mock = InputStreamMock(range(1), callback_mock, sleep=0)
 
         pipeline = Pipeline(input_stream_mock)
 
@@ -368,9 +440,21 @@ class TestPipeline:
         historical_input = pipeline.get_historical_input(5)
         assert historical_input is None
 
+    def test_get_historical_input_returns_none_for_evicted_pulse(self):
+        callback_mock = MagicMock()
+        input_stream_mock = InputStreamMock(range(5), callback_mock, sleep=0)
+
+        pipeline = Pipeline(input_stream_mock, input_data_history_len=2)
+
+        pipeline.run()
+
+        assert pipeline.get_historical_input(3) is None
+        assert pipeline.get_historical_input(5).data == 4
+        assert list(pipeline.get_input_history().keys()) == [4, 5]
+
     def test_get_historical_pom_returns_none_if_index_is_out_of_bounds(self):
         callback_mock = MagicMock()
-        input_stream_mock = InputStreamMock(range(1), callback_mock)
+        input_stream_mock = InputStreamMock(range(1), callback_mock, sleep=0)
 
         pipeline = Pipeline(input_stream_mock)
 
@@ -379,8 +463,8 @@ class TestPipeline:
         historical_pom = pipeline.get_historical_pom(5)
         assert historical_pom is None
 
-    def test_run_perceptor_calls_perceptor_run_with_correct_args(self):
-        pipeline = Pipeline(InputStream())
+    def test_run_perceptor_calls_perceptor_run_with_correct_args(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         callback_mock = MagicMock()
         perceptor_mock = PerceptorMock(
@@ -391,8 +475,8 @@ class TestPipeline:
 
         callback_mock.run.assert_called_once_with(input_data)
 
-    def test_run_perceptor_calls_perceptor_run_for_each_input_data(self):
-        pipeline = Pipeline(InputStream())
+    def test_run_perceptor_calls_perceptor_run_for_each_input_data(self, input_stream):
+        pipeline = Pipeline(input_stream)
 
         callback_mock = MagicMock()
         perceptor_mock = PerceptorMock(
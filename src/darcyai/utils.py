@@ -12,11 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import time
+from functools import lru_cache
 from importlib import import_module as import_helper
-from typing import Any
+from typing import Any, List
 
-imported_modules = {}
+try:
+    _time_ns = time.time_ns
+except AttributeError:
+    # time.time_ns() is only available from Python 3.7
+    def _time_ns() -> int:
+        return int(time.time() * 1000000000)
 
 def validate_not_none(value: Any, message: str) -> None:
     """
@@ -26,7 +33,8 @@ def validate_not_none(value: Any, message: str) -> None:
     value (Any): the value to validate
     message (str): the message to raise if the value is None
     """
-    validate(value is not None, message)
+    if value is None:
+        raise ValueError(message)
 
 
 def validate_type(value: Any, clazz: Any, message: str) -> None:
@@ -38,7 +46,11 @@ def validate_type(value: Any, clazz: Any, message: str) -> None:
     clazz (Any): the class to validate the value against
     message (str): the message to raise if the value is not of the specified type
     """
-    validate(isinstance(value, clazz), message)
+    # Exact type matches are the common case and cheaper than isinstance
+    if type(value) is clazz or isinstance(value, clazz): # pylint: disable=unidiomatic-typecheck
+        return
+
+    raise TypeError(message)
 
 
 def validate(condition: bool, message: str) -> None:
@@ -49,8 +61,8 @@ def validate(condition: bool, message: str) -> None:
     condition (bool): the condition to validate
     message (str): the message to raise if the condition is false
     """
-    if condition is None or not condition:
-        raise Exception(message)
+    if not condition:
+        raise ValueError(message)
 
 
 def timestamp() -> int:
@@ -60,8 +72,9 @@ def timestamp() -> int:
     # Returns
     int: the current timestamp in milliseconds
     """
-    return int(time.time() * 1000)
+    return _time_ns() // 1000000
 
+@lru_cache(maxsize=None)
 def import_module(name: str) -> Any:
     """
     Imports the specified module.
@@ -72,10 +85,31 @@ def import_module(name: str) -> Any:
     # Returns
     Any: the imported module
     """
-    if name in imported_modules:
-        return imported_modules[name]
+    return import_helper(name)
+
 
-    module = import_helper(name)
-    imported_modules[name] = module
+def get_performance_cpus() -> List[int]:
+    """
+    Returns the CPUs with the highest maximum frequency that the process can run on.
+    On big.LITTLE systems these are the big cores. All the CPUs of the process are
+    returned when the frequencies are not available.
 
-    return module
+    # Returns
+    List[int]: the indexes of the CPUs
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+
+    max_frequencies = {}
+    for cpu in cpus:
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/cpuinfo_max_freq",
+                      encoding="utf-8") as file:
+                max_frequencies[cpu] = int(file.read())
+        except (OSError, ValueError):
+            return cpus
+
+    max_frequency = max(max_frequencies.values())
+    return [cpu for cpu in cpus if max_frequencies[cpu] == max_frequency]
@@ -13,25 +13,66 @@
 # limitations under the License.
 
 # Add libraries we need
-import librosa
 import numpy as np
+import os
+import scipy.fft
 
-# Add the Darcy AI Pipeline object
+# Add the Darcy AI Pipeline object and the helper for importing modules lazily
 from darcyai.pipeline import Pipeline
+from darcyai.utils import import_module
 
 # Add our custom InputStream and Perceptor classes
 from audio_input_stream import AudioInputStream
 from audio_analysis_perceptor import AudioAnalysisPerceptor
 
+# librosa's default STFT parameters, used to size the reusable STFT buffers
+STFT_N_FFT = 2048
+STFT_HOP_LENGTH = STFT_N_FFT // 4
+
+
+# Use pyFFTW as the scipy.fft backend, which librosa uses, when it is installed.
+# Its plans are cached between calls, which pays off since every audio window has the same length
+def enable_pyfftw():
+    try:
+        pyfftw = import_module("pyfftw")
+    except ImportError:
+        return
+
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+
+
 # Define a class to hold our demo application
+# Feature extraction with librosa is only enabled with "use_features" so that
+# librosa (and numba, which it pulls in) is not imported when it is not used
 
 
 class AudioAnalyzer():
-    def __init__(self):
+    def __init__(self, use_features=False):
         # Use our custom audio input stream
         mic = AudioInputStream(sample_len_sec=1)
         self.__rate = mic.get_sample_rate()
 
+        self.__use_features = use_features
+        if use_features:
+            librosa = import_module("librosa")
+            enable_pyfftw()
+
+            # The mel filter bank and the MFCC DCT basis only depend on the sample rate,
+            # so build them once instead of on every window
+            self.__mel_basis = librosa.filters.mel(sr=self.__rate, n_fft=STFT_N_FFT)
+            self.__dct_basis = scipy.fft.dct(
+                np.eye(self.__mel_basis.shape[0]), type=2, norm="ortho", axis=0)[:40]
+
+            # Feature buffer that is filled in place for every window
+            self.__features = np.empty((1, 193), dtype=np.float32)
+
+            # STFT output buffers, allocated on the first window and reused afterwards
+            self.__stft_buffer = None
+            self.__magnitude_buffer = None
+
         # Create a Darcy AI pipeline with the audio input stream
         self.__pipeline = Pipeline(input_stream=mic)
 
@@ -47,27 +88,44 @@ class AudioAnalyzer():
 
     # Define a callback to work with the incoming audio data before it passes into the audio analysis perceptor
     def __audio_perceptor_input_callback(self, input_data, pom, config):
-        data = np.frombuffer(input_data.data, dtype=np.float32)
-        return data[:193]
-        return self.__extract_features(data)
+        # The audio input stream already yields the samples as a float32 array
+        if self.__use_features:
+            return self.__extract_features(input_data.data)
+
+        return input_data.data[np.newaxis, :193]
+
+    # Get the STFT output buffer for the given audio window, (re)allocating it only when the
+    # window length changes so librosa does not allocate a new matrix for every window
+    def __get_stft_buffer(self, data):
+        shape = (1 + STFT_N_FFT // 2, 1 + len(data) // STFT_HOP_LENGTH)
+        if self.__stft_buffer is None or self.__stft_buffer.shape != shape:
+            self.__stft_buffer = np.empty(shape, dtype=np.complex64, order="F")
+            self.__magnitude_buffer = np.empty(shape, dtype=np.float32, order="F")
+
+        return self.__stft_buffer
 
     # Perform audio feature extractions using Numpy that we will pass to the audio analysis AI perceptor
     def __extract_features(self, data):
-        features = np.empty((0, 193))
-
-        stft = np.abs(librosa.stft(data))
-        mfccs = np.mean(librosa.feature.mfcc(
-            y=data, sr=self.__rate, n_mfcc=40).T, axis=0)
-        chroma = np.mean(librosa.feature.chroma_stft(
-            S=stft, sr=self.__rate).T, axis=0)
-        mel = np.mean(librosa.feature.melspectrogram(
-            data, sr=self.__rate).T, axis=0)
-        contrast = np.mean(librosa.feature.spectral_contrast(
-            S=stft, sr=self.__rate).T, axis=0)
-        tonnetz = np.mean(librosa.feature.tonnetz(
-            y=librosa.effects.harmonic(data), sr=self.__rate).T, axis=0)
-        ext_features = np.hstack([mfccs, chroma, mel, contrast, tonnetz])
-        features = np.vstack([features, ext_features]).astype(np.float32)
+        librosa = import_module("librosa")
+
+        # Compute the STFT once and derive the mel spectrogram and MFCCs from it
+        # instead of letting each librosa feature recompute its own STFT
+        stft = np.abs(librosa.stft(data, out=self.__get_stft_buffer(data)),
+                      out=self.__magnitude_buffer)
+        mel_spectrogram = self.__mel_basis @ (stft ** 2)
+
+        # Average each feature over time straight into its slice of the feature buffer:
+        # 40 MFCCs, 12 chroma, 128 mel, 7 spectral contrast and 6 tonnetz values
+        features = self.__features
+        np.mean(self.__dct_basis @ librosa.power_to_db(mel_spectrogram),
+                axis=1, out=features[0, 0:40])
+        np.mean(librosa.feature.chroma_stft(S=stft, sr=self.__rate),
+                axis=1, out=features[0, 40:52])
+        np.mean(mel_spectrogram, axis=1, out=features[0, 52:180])
+        np.mean(librosa.feature.spectral_contrast(S=stft, sr=self.__rate),
+                axis=1, out=features[0, 180:187])
+        np.mean(librosa.feature.tonnetz(y=librosa.effects.harmonic(data), sr=self.__rate),
+                axis=1, out=features[0, 187:193])
 
         return features
 
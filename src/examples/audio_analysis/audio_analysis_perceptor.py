@@ -15,13 +15,27 @@
 # Add libraries as needed, including TensorFlow Lite
 import numpy as np
 import os
+from collections import OrderedDict
+from functools import lru_cache
 import pathlib
+import sys
 import tflite_runtime.interpreter as tflite
 
 # Add Darcy AI libraries needed, particularly Perceptor base class and Config
 from darcyai.perceptor.perceptor import Perceptor
 from darcyai.config import Config
 
+# Maximum number of memoized predictions kept by the perceptor
+MEMO_MAX_SIZE = 256
+
+
+# Load the sound names from a labels file, one per line. The result is cached
+# so that multiple perceptors share it instead of reading the file again
+@lru_cache(maxsize=None)
+def _load_labels(labels_file):
+    with open(labels_file) as file:
+        return tuple(line.rstrip() for line in file)
+
 
 # Define our custom Darcy AI Perceptor class
 class AudioAnalysisPerceptor(Perceptor):
@@ -39,11 +53,19 @@ class AudioAnalysisPerceptor(Perceptor):
         super().__init__(model_path=model_file)
 
         # Default our AI interpreter to None (it will get used below)
-        # Open the labels file and import the text values
+        # Import the text values of the labels file into a string array
+        # so that the labels of several predictions can be looked up at once
         self.__interpreter = None
-        with open(labels_file) as file:
-            lines = file.readlines()
-            self.__sound_names = [line.rstrip() for line in lines]
+        self.__memo = OrderedDict()
+        self.__sound_names = np.array(_load_labels(labels_file), dtype=str)
+
+        # Near-identical windows (steady background noise, silence) produce the same predictions,
+        # so features are quantized with this step and the predictions for them are memoized
+        self.set_config_schema([
+            Config("memo_quant_step", "Memo quantization step", "float", 1 / 64,
+                   "Step used to quantize the input features when looking up memoized predictions."
+                   " Predictions are not memoized when it is not greater than 0"),
+        ])
 
     # Define our "run" method which is where the Perceptor does its processing against the current data
     def run(self, input_data, config):
@@ -55,25 +77,66 @@ class AudioAnalysisPerceptor(Perceptor):
             This is expected to be a [1, 193] float32 numpy array.
         config (Config): The configuration for the perceptor.
         """
-        # Set the data into the AI model and retrieve the raw results
-        self.__interpreter.set_tensor(
-            self.__input_details[0]['index'], input_data)
-        self.__interpreter.invoke()
-        tflite_model_predictions = self.__interpreter.get_tensor(
-            self.__output_details[0]['index'])
+        # Reuse the predictions of a similar window if we have seen one recently.
+        # The memo is skipped when the quantization step is not a positive number
+        memo_quant_step = config.memo_quant_step
+        signature = None
+        tflite_model_predictions = None
+        if memo_quant_step > 0:
+            signature = np.round(
+                input_data[0, ::12] / memo_quant_step).astype(np.int64).tobytes()
+            tflite_model_predictions = self.__memo.get(signature)
+
+        if tflite_model_predictions is not None:
+            self.__memo.move_to_end(signature)
+        else:
+            # Set the data into the AI model and retrieve the raw results
+            self.__interpreter.set_tensor(
+                self.__input_details[0]['index'], self.__quantize_input(input_data))
+            self.__interpreter.invoke()
+            tflite_model_predictions = self.__dequantize_output(self.__interpreter.get_tensor(
+                self.__output_details[0]['index']))
+
+            if signature is not None:
+                self.__memo[signature] = tflite_model_predictions
+                if len(self.__memo) > MEMO_MAX_SIZE:
+                    self.__memo.popitem(last=False)
 
         # Break apart the raw results and the confidence levels
         # If the predictions meet a confidence threshold, list them as outputs
-        ind = np.argpartition(tflite_model_predictions[0], -2)[-2:]
-        ind[np.argsort(tflite_model_predictions[0][ind])]
-        ind = ind[::-1]
-        top_certainty = int(tflite_model_predictions[0, ind[0]] * 100)
-        second_certainty = int(tflite_model_predictions[0, ind[1]] * 100)
+        predictions = tflite_model_predictions[0]
+        top_index = int(predictions.argmax())
+        top_certainty = int(predictions[top_index] * 100)
         if top_certainty > 60:
-            print(
-                f"Top guess: {self.__sound_names[ind[0]]} ({top_certainty}%)")
-            print(
-                f"Second guess: {self.__sound_names[ind[1]]} ({second_certainty}%)")
+            second_index = int(np.delete(predictions, top_index).argmax())
+            if second_index >= top_index:
+                second_index += 1
+            second_certainty = int(predictions[second_index] * 100)
+            sys.stdout.write(
+                f"Top guess: {self.__sound_names[top_index]} ({top_certainty}%)\n"
+                f"Second guess: {self.__sound_names[second_index]} ({second_certainty}%)\n")
+
+    # Quantize the input features when the model takes a quantized (int8/uint8) input tensor
+    def __quantize_input(self, input_data):
+        input_dtype = self.__input_details[0]['dtype']
+        if input_dtype == np.float32:
+            return input_data
+
+        scale, zero_point = self.__input_details[0]['quantization']
+        quantized = np.round(input_data / scale + zero_point)
+        limits = np.iinfo(input_dtype)
+        np.clip(quantized, limits.min, limits.max, out=quantized)
+        self.__input_buffer[:] = quantized
+
+        return self.__input_buffer
+
+    # Convert quantized model outputs back to float confidences
+    def __dequantize_output(self, output_data):
+        if self.__output_details[0]['dtype'] == np.float32:
+            return output_data
+
+        scale, zero_point = self.__output_details[0]['quantization']
+        return (output_data.astype(np.float32) - zero_point) * scale
 
     # Define our "load" method which is used by the Darcy AI Pipeline to set up our custom Percpetor
     def load(self, accelerator_idx=None):
@@ -90,6 +153,8 @@ class AudioAnalysisPerceptor(Perceptor):
 
         self.__input_details = self.__interpreter.get_input_details()
         self.__output_details = self.__interpreter.get_output_details()
+        self.__input_buffer = np.empty(
+            self.__input_details[0]['shape'], dtype=self.__input_details[0]['dtype'])
 
         self.__interpreter.allocate_tensors()
 
@@ -12,27 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Add libraries for audio input and math operations
-import audioop
-import math
+# Add libraries for audio input, math operations and threading
+import numpy as np
 import pyaudio
+import threading
 
 # Add Darcy AI libraries that we need, particularly InputStream and StreamData
 from darcyai.input.input_stream import InputStream
 from darcyai.stream_data import StreamData
 from darcyai.utils import timestamp, validate_type, validate_not_none, validate
 
+# Number of audio samples (windows of sample_len_sec) the capture ring buffer can hold
+RING_BUFFER_WINDOWS = 4
+
 # Define our own Darcy AI InputStream class
 
 
 class AudioInputStream(InputStream):
     """
     AudioInputStream is an input stream that reads audio data from a microphone.
+    The audio samples are yielded as a float32 numpy array.
 
     # Arguments
     chunk_size: The size of the audio data chunk.
         Defaults to 1024.
-    format: The format of the audio data.
+    format: The format of the audio data. Only pyaudio.paFloat32 is supported.
         Defaults to pyaudio.paFloat32.
     sample_len_sec: The length of the audio sample in seconds.
         Defaults to 5.
@@ -51,6 +55,7 @@ class AudioInputStream(InputStream):
 
         validate_not_none(format, "format must be provided")
         validate_type(format, int, "format must be an integer")
+        validate(format == pyaudio.paFloat32, "format must be pyaudio.paFloat32")
         self.__format = format
 
         validate_not_none(sample_len_sec, "sample_len_sec must be provided")
@@ -60,8 +65,15 @@ class AudioInputStream(InputStream):
 
         # Set up class properties with default starting values
         self.__audio_stream = None
+        self.__capture_thread = None
+        self.__ring = None
+        self.__max_read_frames = 0
+        self.__written = 0
+        self.__data_ready = threading.Event()
+        self.__samples = None
         self.__stopped = True
-        self.__threshold = 30000
+        # RMS amplitude below which a sample is considered silence
+        self.__threshold = 0.01
 
         # Set up audio library
         self.__pyaudio = pyaudio.PyAudio()
@@ -79,6 +91,10 @@ class AudioInputStream(InputStream):
         Stops the audio stream.
         """
         self.__stopped = True
+        self.__data_ready.set()
+        if self.__capture_thread is not None:
+            self.__capture_thread.join()
+            self.__capture_thread = None
         if self.__audio_stream is not None:
             self.__audio_stream.stop_stream()
             self.__audio_stream.close()
@@ -100,24 +116,60 @@ class AudioInputStream(InputStream):
             input_device_index=self.__input_device_index)
         self.__stopped = False
 
+        # Capture the audio in a background thread into a ring buffer so that slow
+        # processing down the pipeline doesn't stall the microphone reads
+        sample_count = int(self.__rate / self.__chunk_size * self.__sample_len_sec) * \
+            self.__chunk_size * self.__channels
+        self.__samples = np.empty(sample_count, dtype=np.float32)
+        self.__ring = np.empty(sample_count * RING_BUFFER_WINDOWS, dtype=np.float32)
+        self.__max_read_frames = sample_count // self.__channels
+        self.__written = 0
+        self.__data_ready.clear()
+        self.__capture_thread = threading.Thread(target=self.__capture, daemon=True)
+        self.__capture_thread.start()
+
         # Run a loop whenever our InputStream is not "stopped"
-        # Fetch the audio samples coming from the audio stream object
+        # Wait for a full audio sample in the ring buffer and copy it out
         # Evaluate the audio signal and ignore it if the signal is below the threshold
         # If it passes the threshold, send out the audio data so it will enter the Darcy AI pipeline
+        consumed = 0
         while not self.__stopped:
-            frames = []
-            for i in range(0, int(self.__rate / self.__chunk_size * self.__sample_len_sec)):
-                data = self.__audio_stream.read(
-                    self.__chunk_size, exception_on_overflow=False)
-                frames.append(data)
-
-            data = b"".join(frames)
-            avg = math.sqrt(abs(audioop.avg(data, 4)))
-            if avg < self.__threshold:
-                yield StreamData(data, timestamp())
+            self.__data_ready.clear()
+            if self.__written - consumed < sample_count:
+                self.__data_ready.wait()
+                continue
+
+            # If we fell behind and the capture thread overwrote older samples, skip to the latest
+            consumed = max(consumed, self.__written - self.__ring.size + sample_count)
+            start = consumed % self.__ring.size
+            head = min(sample_count, self.__ring.size - start)
+            self.__samples[:head] = self.__ring[start:start + head]
+            self.__samples[head:] = self.__ring[:sample_count - head]
+            consumed += sample_count
+
+            rms = np.sqrt(np.dot(self.__samples, self.__samples) / self.__samples.size)
+            if rms >= self.__threshold:
+                yield StreamData(self.__samples.copy(), timestamp())
             else:
                 print("Silence detected")
 
+    # Define the capture loop that runs in the background thread.
+    # It reads everything that is already available in one call instead of one chunk at a time
+    # and writes the samples into the ring buffer
+    def __capture(self):
+        while not self.__stopped:
+            frames = min(max(self.__chunk_size, self.__audio_stream.get_read_available()),
+                         self.__max_read_frames)
+            data = np.frombuffer(
+                self.__audio_stream.read(frames, exception_on_overflow=False), dtype=np.float32)
+
+            start = self.__written % self.__ring.size
+            head = min(data.size, self.__ring.size - start)
+            self.__ring[start:start + head] = data[:head]
+            self.__ring[:data.size - head] = data[head:]
+            self.__written += data.size
+            self.__data_ready.set()
+
     # Define a method for getting the sample rate
     def get_sample_rate(self):
         """
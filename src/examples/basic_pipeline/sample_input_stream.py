@@ -13,6 +13,7 @@
 # limitations under the License.
 
 # Add the DarcyAI components that we need, particularly the InputStream and StreamData
+import threading
 import time
 from darcyai.input.input_stream import InputStream
 from darcyai.stream_data import StreamData
@@ -24,18 +25,29 @@ from darcyai.utils import timestamp
 class SampleInputStream(InputStream):
     def __init__(self,):
         # Default to "stopped"
-        self.__stopped = True
+        self.__stopped = threading.Event()
+        self.__stopped.set()
 
     # Define our "stop" method
     def stop(self):
-        self.__stopped = True
+        self.__stopped.set()
 
     # Define our "stream" method which allows the data to flow
     def stream(self):
-        self.__stopped = False
-
-        # Make a simple loop that pauses for one second and then sends a string as data
-        while not self.__stopped:
-            time.sleep(1)
+        self.__stopped.clear()
+
+        # Make a simple loop that sends a string as data once per second
+        # Sleep until the next deadline rather than for a full second so the time spent
+        # processing each item doesn't add up and make the stream drift
+        deadline = time.monotonic()
+        while not self.__stopped.is_set():
+            deadline += 1
+            now = time.monotonic()
+            if deadline > now:
+                # Wait on the "stopped" event so that "stop" doesn't have to wait for the deadline
+                if self.__stopped.wait(deadline - now):
+                    break
+            else:
+                deadline = now
 
             yield(StreamData("Hello!", timestamp()))
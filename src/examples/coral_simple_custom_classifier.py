@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import cv2
-import os
+import numpy as np
 import pathlib
 
 from darcyai.perceptor.coral.image_classification_perceptor import ImageClassificationPerceptor
@@ -22,15 +22,27 @@ from darcyai.output.live_feed_stream import LiveFeedStream
 from darcyai.pipeline import Pipeline
 
 def mask_check_input_callback(input_data, pom, config):
-    frame = input_data.data.copy()
-    crop_face = frame[200:280, 280:360]
+    crop_face = input_data.data[200:280, 280:360]
     color_cvt_face = cv2.cvtColor(crop_face, cv2.COLOR_BGR2RGB)
 
     return color_cvt_face
 
 
+# Live feed frames are drawn on a copy of the camera frame that is reused from one pulse to the next
+live_feed_frame = None
+
+
+def copy_to_live_feed_frame(frame):
+    global live_feed_frame
+    if live_feed_frame is None or live_feed_frame.shape != frame.shape:
+        live_feed_frame = np.empty_like(frame)
+    np.copyto(live_feed_frame, frame)
+
+    return live_feed_frame
+
+
 def live_feed_callback(pom, input_data):
-    frame = input_data.data.copy()
+    frame = copy_to_live_feed_frame(input_data.data)
 
     if len(pom.mask_check[1]) > 0:
         label = pom.mask_check[1][0]
@@ -52,7 +64,8 @@ live_feed = LiveFeedStream(path="/", port=3456)
 pipeline.add_output_stream("output", live_feed_callback, live_feed)
 
 script_dir = pathlib.Path(__file__).parent.absolute()
-model_file = os.path.join(script_dir, "models", "face_mask_detection.tflite")
+models_dir = script_dir / "models"
+model_file = str(models_dir / "face_mask_detection.tflite")
 labels = {
     0: "No Mask",
     1: "Mask",
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
+
 from darcyai.input.camera_stream import CameraStream
 from darcyai.input.input_multi_stream import InputMultiStream
 from darcyai.tests.perceptor_mock import PerceptorMock
@@ -20,12 +23,17 @@ from darcyai.stream_data import StreamData
 from sample_input_stream import SampleInputStream
 from sample_output_stream import SampleOutputStream
 
+# How many times the aggregator yields the CPU waiting for a ping before it blocks.
+# Keep it small: it only helps when pings arrive faster than a blocking wait wakes up
+SPIN_ITERATIONS = 256
+
 
 class MultiStreamDemo():
     def __init__(self):
-        self.__last_frame = None
-        self.__last_frame_timestamp = 0
-        self.__send = False
+        # The latest camera frame and its timestamp are published together as one tuple,
+        # so the aggregator never pairs a frame with the timestamp of another one
+        self.__last_frame = (None, 0)
+        self.__send = threading.Event()
 
         camera = CameraStream(video_device="/dev/video0")
         ping = SampleInputStream()
@@ -41,7 +49,8 @@ class MultiStreamDemo():
         self.__pipeline.add_output_stream("output", self.__output_stream_callback, output_stream)
 
         p1 = PerceptorMock()
-        self.__pipeline.add_perceptor("p1", p1, accelerator_idx=0, input_callback=self.__perceptor_input_callback)
+        # The perceptor takes the input data as is, so no input callback is needed
+        self.__pipeline.add_perceptor("p1", p1, accelerator_idx=0)
 
 
     def run(self):
@@ -50,23 +59,22 @@ class MultiStreamDemo():
 
     def __input_stream_callback(self, stream_name, stream_data):
         if stream_name == "camera":
-            self.__last_frame = stream_data.data
-            self.__last_frame_timestamp = stream_data.timestamp
+            self.__last_frame = (stream_data.data, stream_data.timestamp)
         elif stream_name == "ping":
-            self.__send = True
+            self.__send.set()
 
 
     def __input_aggregator(self):
-        while not self.__send:
-            continue
-
-        self.__send = False
-        
-        return StreamData({ "camera": self.__last_frame }, self.__last_frame_timestamp)
-
-
-    def __perceptor_input_callback(self, input_data, pom, config):
-        return input_data
+        for _ in range(SPIN_ITERATIONS):
+            if self.__send.is_set():
+                break
+            time.sleep(0)
+        else:
+            self.__send.wait()
+        self.__send.clear()
+
+        last_frame, last_frame_timestamp = self.__last_frame
+        return StreamData({ "camera": last_frame }, last_frame_timestamp)
 
 
     def __output_stream_callback(self, pom, input_data):
@@ -49,14 +49,16 @@ class MultiPerceptorDemo():
             "config_1": "value_1",
             "config_2": 2,
         }
-        self.__pipeline.add_perceptor("p1", p1, parent=None, multi=False, accelerator_idx=0, input_callback=self.__input_callback, output_callback=self.__output_callback, default_config=default_config)
-        self.__pipeline.add_perceptor("p2", p2, parent=None, multi=False, accelerator_idx=1, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p3", p3, parent=None, multi=False, accelerator_idx=1, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p11", p11, parent="p1", multi=False, accelerator_idx=0, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p12", p12, parent="p1", multi=False, accelerator_idx=1, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p21", p21, parent="p2", multi=False, accelerator_idx=0, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p31", p31, parent="p3", multi=False, accelerator_idx=1, input_callback=self.__input_callback)
-        self.__pipeline.add_perceptor("p121", p121, parent="p12", multi=False, accelerator_idx=1, input_callback=self.__input_callback)
+        self.__pipeline.add_perceptors([
+            {"name": "p1", "perceptor": p1, "accelerator_idx": 0, "input_callback": self.__input_callback, "output_callback": self.__output_callback, "default_config": default_config},
+            {"name": "p2", "perceptor": p2, "accelerator_idx": 1, "input_callback": self.__input_callback},
+            {"name": "p3", "perceptor": p3, "accelerator_idx": 1, "input_callback": self.__input_callback},
+            {"name": "p11", "perceptor": p11, "parent": "p1", "accelerator_idx": 0, "input_callback": self.__input_callback},
+            {"name": "p12", "perceptor": p12, "parent": "p1", "accelerator_idx": 1, "input_callback": self.__input_callback},
+            {"name": "p21", "perceptor": p21, "parent": "p2", "accelerator_idx": 0, "input_callback": self.__input_callback},
+            {"name": "p31", "perceptor": p31, "parent": "p3", "accelerator_idx": 1, "input_callback": self.__input_callback},
+            {"name": "p121", "perceptor": p121, "parent": "p12", "accelerator_idx": 1, "input_callback": self.__input_callback},
+        ])
 
         self.__pipeline.set_perceptor_config("p1", "config_3", True)
 
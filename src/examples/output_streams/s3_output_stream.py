@@ -12,13 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Add the AWS SDK library for Python
+# Add the AWS SDK library for Python and the libraries for uploading in the background
 import boto3
+import io
+import threading
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the DarcyAI components that we need, particularly the OutputStream
 from darcyai.output.output_stream import OutputStream
 from darcyai.utils import validate_not_none, validate_type
 
+# Number of uploads that can run at the same time
+MAX_CONCURRENT_UPLOADS = 8
+
+# Number of uploads, running or waiting, that are kept in memory before new writes are dropped
+MAX_PENDING_UPLOADS = MAX_CONCURRENT_UPLOADS * 4
+
+# Payloads of at least this many bytes are uploaded in concurrent multipart chunks
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
 # Define our own OutputStream class
 
 
@@ -26,6 +39,9 @@ class S3Stream(OutputStream):
     """
     A stream that writes data to a AWS S3 bucket.
 
+    Uploads run in the background. When S3 falls behind and MAX_PENDING_UPLOADS
+    uploads are already pending, new writes are dropped instead of being queued,
+    so that memory use stays bounded and the pipeline is never blocked.
     """
 
     def __init__(self,
@@ -36,21 +52,13 @@ class S3Stream(OutputStream):
         # Call init on the parent class
         super().__init__()
 
-        # Validate all input parameters
-        validate_not_none(bucket, "bucket is required")
-        validate_type(bucket, str, "bucket must be a string")
-
-        validate_not_none(aws_access_key_id, "aws_access_key_id is required")
-        validate_type(aws_access_key_id, str,
-                      "aws_access_key_id must be a string")
-
-        validate_not_none(aws_secret_access_key,
-                          "aws_secret_access_key is required")
-        validate_type(aws_secret_access_key, str,
-                      "aws_secret_access_key must be a string")
-
-        validate_not_none(aws_region, "aws_region is required")
-        validate_type(aws_region, str, "aws_region must be a string")
+        # Validate all input parameters, which are all required strings
+        for name, value in (("bucket", bucket),
+                            ("aws_access_key_id", aws_access_key_id),
+                            ("aws_secret_access_key", aws_secret_access_key),
+                            ("aws_region", aws_region)):
+            validate_not_none(value, f"{name} is required")
+            validate_type(value, str, f"{name} must be a string")
 
         # Create an AWS session
         session = boto3.Session(
@@ -63,10 +71,17 @@ class S3Stream(OutputStream):
         s3 = session.resource('s3')
         self.__bucket = s3.Bucket(bucket)
 
+        # Upload in background threads so that the pipeline doesn't wait for S3 on every write
+        self.__executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS)
+        self.__transfer_config = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD,
+                                                max_concurrency=4)
+        self.__pending_uploads = threading.BoundedSemaphore(MAX_PENDING_UPLOADS)
+
     # Define the "write" method which outputs data on the stream
     def write(self, data: tuple) -> None:
         """
         Writes data to the stream.
+        The data is dropped when MAX_PENDING_UPLOADS uploads are already pending.
 
         Arguments:
             data (tuple[str, Any]) -- A tuple of the form (key, data)
@@ -82,16 +97,40 @@ class S3Stream(OutputStream):
         validate_type(data, tuple, "data must be a tuple")
         validate_type(data[0], str, "data[0] must be a string")
 
-        # Send up the data using the "put_object" method on the S3 bucket
+        # Drop the data rather than holding on to it when too many uploads are pending
+        if not self.__pending_uploads.acquire(blocking=False):
+            return
+
+        # Send up the data in the background and return right away
         key = data[0]
         value = data[1]
-        self.__bucket.put_object(Key=key, Body=value)
+        try:
+            future = self.__executor.submit(self.__upload, key, value)
+        except Exception:
+            self.__pending_uploads.release()
+            raise
+        future.add_done_callback(self.__finish_upload)
+
+    # Upload a single object, using a multipart upload for large payloads
+    # and a plain "put_object" for small ones such as JPEG frames
+    def __upload(self, key, value):
+        if isinstance(value, (bytes, bytearray)) and len(value) >= MULTIPART_THRESHOLD:
+            self.__bucket.upload_fileobj(io.BytesIO(value), key, Config=self.__transfer_config)
+        else:
+            self.__bucket.put_object(Key=key, Body=value)
+
+    # Free the upload's pending slot and report uploads that failed in the background
+    def __finish_upload(self, future):
+        self.__pending_uploads.release()
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to upload to S3: {error}")
 
     # Define the "close" method for the OutputStream object
 
     def close(self) -> None:
         """
-        Closes the output stream.
+        Closes the output stream, waiting for the pending uploads to finish.
 
         Arguments:
             None
@@ -99,4 +138,4 @@ class S3Stream(OutputStream):
         Returns:
             None
         """
-        pass
+        self.__executor.shutdown(wait=True)
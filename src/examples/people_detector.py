@@ -22,41 +22,46 @@ from darcyai.config import RGB
 from darcyai.perceptor.processor import Processor
 from darcyai.perceptor.people_perceptor import PeoplePerceptor
 
+# Font and colors of the text we put on the live feed
+LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+LABEL_FONT_SCALE = 0.7
+LABEL_THICKNESS = 2
+PEOPLE_COUNT_COLOR = (0, 255, 0)
+FACE_HEIGHT_COLOR = (0, 255, 255)
+
 # Create a callback function for handling the input that is about to pass to the People Perceptor
 
 
 def people_input_callback(input_data, pom, config):
     # Just take the frame from the incoming Input Stream and send it onward - no need to modify the frame
-    frame = input_data.data.copy()
-    return frame
+    # The People Perceptor only reads the frame, so there is no need to copy it either
+    return input_data.data
 
 # Create a callback function for handling the Live Feed output stream data before it gets presented
 
 
 def live_feed_callback(pom, input_data):
     # Start wth the annotated video frame available from the People Perceptor
-    frame = pom.peeps.annotatedFrame().copy()
+    # We draw text on it below, so work on a copy to leave the frame in the POM untouched
+    peeps = pom.peeps
+    frame = peeps.annotatedFrame().copy()
 
     # Add some text telling how many people are in the scene
-    label = "{} peeps".format(pom.peeps.peopleCount())
-    color = (0, 255, 0)
-    cv2.putText(frame, str(label), (0, 20),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+    people_count = peeps.peopleCount()
+    label = f"{people_count} peeps"
+    cv2.putText(frame, label, (0, 20),
+                LABEL_FONT, LABEL_FONT_SCALE, PEOPLE_COUNT_COLOR, LABEL_THICKNESS)
 
     # If we have anyone, demonstrate looking up that person in the POM by getting their face size
     # And then put it on the frame as some text
     # NOTE: this will just take the face size from the last person in the array
-    if pom.peeps.peopleCount() > 0:
-        for person_id in pom.peeps.people():
-            face_size = pom.peeps.faceSize(person_id)
-            if face_size == 0:
-                continue
-
-            face_height = face_size[1]
-            label2 = "{} face height".format(face_height)
-            color = (0, 255, 255)
-            cv2.putText(frame, str(label2), (0, 60),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+    if people_count > 0:
+        person_id = next(reversed(peeps.people()))
+        face_height = peeps.faceSize(person_id)[1]
+        if face_height > 0:
+            label2 = f"{face_height} face height"
+            cv2.putText(frame, label2, (0, 60),
+                        LABEL_FONT, LABEL_FONT_SCALE, FACE_HEIGHT_COLOR, LABEL_THICKNESS)
 
     # Pass the finished frame out of this callback so the Live Feed output stream can display it
     return frame
@@ -88,21 +93,18 @@ people_ai = PeoplePerceptor(
 people_ai.on("new_person_entered_scene", new_person_callback)
 
 # Add the People Perceptor instance to the Pipeline and use the input callback from above as the input preparation handler
+# Set up its configuration at the same time to show the pose landmark dots, rectangles and person IDs on the annotated video frame
 pipeline.add_perceptor(
-    "peeps", people_ai, input_callback=people_input_callback)
-
-# Update the configuration of the People Perceptor to show the pose landmark dots on the annotated video frame
-pipeline.set_perceptor_config("peeps", "show_pose_landmark_dots", True)
-pipeline.set_perceptor_config("peeps", "pose_landmark_dot_size", 2)
-pipeline.set_perceptor_config(
-    "peeps", "pose_landmark_dot_color", RGB(0, 255, 0))
-pipeline.set_perceptor_config("peeps", "show_body_rectangle", True)
-pipeline.set_perceptor_config("peeps", "show_face_rectangle", True)
-pipeline.set_perceptor_config("peeps", "show_person_id", True)
-pipeline.set_perceptor_config(
-    "peeps", "person_data_identity_text_font_size", 0.5)
-pipeline.set_perceptor_config(
-    "peeps", "person_data_identity_text_font_size", 0.5)
+    "peeps", people_ai, input_callback=people_input_callback,
+    default_config={
+        "show_pose_landmark_dots": True,
+        "pose_landmark_dot_size": 2,
+        "pose_landmark_dot_color": RGB(0, 255, 0),
+        "show_body_rectangle": True,
+        "show_face_rectangle": True,
+        "show_person_id": True,
+        "person_data_identity_text_font_size": 0.5,
+    })
 
 # Start the Pipeline
 pipeline.run()
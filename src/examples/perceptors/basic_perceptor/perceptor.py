@@ -62,6 +62,7 @@ class BasicPerceptor(Perceptor):
         # If the sleep parameter is passed, use it
         # Otherwise set a random sleep
         self.__counter = 0
+        self.__next_run = None
         if sleep is not None:
             self.__sleep = sleep
         else:
@@ -69,8 +70,17 @@ class BasicPerceptor(Perceptor):
 
     # Define our "run" method
     def run(self, input_data, config):
-        # Simply sleep for the configured amount of time
-        time.sleep(self.__sleep)
+        # Simply wait until the configured amount of time has passed since the previous run
+        # Time the pipeline spent elsewhere since then counts towards it, so we only block
+        # for whatever is left instead of the full amount on every pulse
+        if self.__next_run is None:
+            self.__next_run = time.monotonic()
+        self.__next_run += self.__sleep
+        delay = self.__next_run - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            self.__next_run = time.monotonic()
         self.__counter += 1
 
         # Produce a simple text string output with the counter value so a consumer of this demo can see it is going up
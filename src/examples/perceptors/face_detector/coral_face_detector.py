@@ -71,12 +71,7 @@ class CoralFaceDetector(ObjectDetectionPerceptor):
         # Get the AI model result by calling "run" on the parent class where we have already passed our AI model
         perception_result = super().run(input_data=input_data, config=config)
 
-        # Create an empty result array and then fill it by checking all results against the configured threshold
-        result = []
-        if len(perception_result) > 0:
-            for detection in perception_result:
-                if detection.class_id == 0 and detection.confidence >= config.threshold:
-                    result.append(detection)
-
-        # Send out our filtered results
-        return result
+        # Keep only the face detections that pass the configured threshold and send them out
+        threshold = config.threshold
+        return [detection for detection in perception_result
+                if detection.class_id == 0 and detection.confidence >= threshold]
@@ -34,6 +34,11 @@ class SamplePipeline():
         # Use the CameraStream input stream
         camera = CameraStream(video_device="/dev/video0", fps=20)
 
+        # RGB copy of the current video frame for the face detector and annotated copy
+        # for the live feed, both reused for every frame
+        self.__rgb_frame = None
+        self.__live_feed_frame = None
+
         # Set up a Flask app so we can host a live video stream viewing UI and a configuration REST API
         self.__flask_app = Flask(__name__)
 
@@ -64,8 +69,13 @@ class SamplePipeline():
 
     # Define a callback for working with the live feed
     # Take the incoming data which is a video frame and draw rectangles on the faces
+    # The rectangles are drawn on a copy of the frame that is reused for every frame
+    # instead of allocating a new full size frame each time
     def __live_feed_callback(self, pom, input_data):
-        frame = input_data.data.copy()
+        if self.__live_feed_frame is None or self.__live_feed_frame.shape != input_data.data.shape:
+            self.__live_feed_frame = np.empty_like(input_data.data)
+        frame = self.__live_feed_frame
+        np.copyto(frame, input_data.data)
 
         for face in pom.face:
             cv2.rectangle(frame, (face.xmin, face.ymin),
@@ -75,11 +85,13 @@ class SamplePipeline():
 
     # Define a callback for handling the input that goes into the face detector Perceptor
     # We just need to change the color order of the video frame because our AI model wants RGB instead of BGR
+    # cv2.cvtColor already writes into a new frame so there is no need to copy the input first,
+    # and we let it reuse the same RGB frame from one pulse to the next
     def __face_input_callback(self, input_data, pom, config):
-        frame = input_data.data.copy()
-        color_cvt_face = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.__rgb_frame = cv2.cvtColor(
+            input_data.data, cv2.COLOR_BGR2RGB, dst=self.__rgb_frame)
 
-        return color_cvt_face
+        return self.__rgb_frame
 
 
 # In the main thread, start the application by instantiating our demo class and calling "run"
@@ -57,6 +57,8 @@ class FaceMaskPerceptor(ImageClassificationPerceptor):
                  "threshold must be a number between 0 and 1")
 
         # Call "init" on the parent class and pass our AI model information
+        # The CPU model is fully quantized (uint8 input, weights and output), so the CPU
+        # fallback runs integer inference and its scores are dequantized with "quantized"
         super().__init__(processor_preference={
             Processor.CORAL_EDGE_TPU: {
                 "model_path": coral_model_file,
@@ -68,7 +70,8 @@ class FaceMaskPerceptor(ImageClassificationPerceptor):
             },
         },
             threshold=0,
-            top_k=2)
+            top_k=2,
+            quantized=True)
 
         # Add a configuration item to the list, in this case a threshold setting that is a floating point value
         # This will show up in the configuration REST API
@@ -92,17 +95,9 @@ class FaceMaskPerceptor(ImageClassificationPerceptor):
         perception_result = super().run(input_data=input_data, config=config)
 
         # Check the output to see if the mask detection crosses the configured threshold
-        has_mask = False
-        if len(perception_result) > 0:
-            try:
-                idx = [i for i, x in enumerate(
-                    perception_result) if x.name == 'Mask']
-                if len(idx) > 0:
-                    threshold = self.get_config_value("threshold") / 100
-                    has_mask = bool(
-                        perception_result[idx[0]].confidence >= threshold)
-            except:
-                has_mask = False
+        # The threshold is read from the config registry the pipeline passes in
+        mask = next((x for x in perception_result if x.name == 'Mask'), None)
+        has_mask = mask is not None and bool(mask.confidence >= config.threshold / 100)
 
         # Wrap the result in the POM-compatible class and send it out
         return FaceMaskDetectionModel(has_mask)
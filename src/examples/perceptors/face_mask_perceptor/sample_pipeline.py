@@ -31,6 +31,11 @@ from face_mask_perceptor import FaceMaskPerceptor
 
 class SamplePipeline():
     def __init__(self):
+        # Annotated copy of the current video frame for the live feed and RGB copy of the
+        # face region for the face mask detector, both reused for every frame
+        self.__live_feed_frame = None
+        self.__rgb_face = None
+
         # Use the CameraStream input stream
         camera = CameraStream(video_device="/dev/video0", fps=20)
 
@@ -65,8 +70,13 @@ class SamplePipeline():
 
     # Define a callback for working with the live feed
     # Take the incoming data which is a video frame and add information about detected or not detected face masks
+    # The frame is drawn on a copy that is reused from one pulse to the next
+    # instead of allocating a new full size frame each time
     def __live_feed_callback(self, pom, input_data):
-        frame = input_data.data.copy()
+        if self.__live_feed_frame is None or self.__live_feed_frame.shape != input_data.data.shape:
+            self.__live_feed_frame = np.empty_like(input_data.data)
+        frame = self.__live_feed_frame
+        np.copyto(frame, input_data.data)
 
         color, label = ((0, 255, 0), "Mask") if pom.face_mask.has_mask() else (
             (0, 0, 255), "No Mask")
@@ -78,12 +88,13 @@ class SamplePipeline():
 
     # Define a callback for handling the input that goes into the face mask detector Perceptor
     # We just need to crop the frame down to just the center and change the color order of the video frame because our AI model wants RGB instead of BGR
+    # The crop is a view into the frame and cvtColor writes the RGB face into the same buffer on every pulse,
+    # so neither the frame nor the face is copied into a new array
     def __mask_check_input_callback(self, input_data, pom, config):
-        frame = input_data.data.copy()
-        crop_face = frame[200:280, 280:360]
-        color_cvt_face = cv2.cvtColor(crop_face, cv2.COLOR_BGR2RGB)
+        crop_face = input_data.data[200:280, 280:360]
+        self.__rgb_face = cv2.cvtColor(crop_face, cv2.COLOR_BGR2RGB, dst=self.__rgb_face)
 
-        return color_cvt_face
+        return self.__rgb_face
 
 
 # In the main thread, start the application by instantiating our demo class and calling "run"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import time
 from darcyai.input.input_stream import InputStream
 from darcyai.stream_data import StreamData
@@ -19,17 +20,26 @@ from darcyai.utils import timestamp
 
 class SampleInputStream(InputStream):
     def __init__(self,):
-        self.__stopped = True
+        self.__stopped = threading.Event()
+        self.__stopped.set()
 
 
     def stop(self):
-        self.__stopped = True
+        self.__stopped.set()
 
 
     def stream(self):
-        self.__stopped = False
-
-        while not self.__stopped:
-            time.sleep(1)
+        self.__stopped.clear()
+
+        deadline = time.monotonic()
+        while not self.__stopped.is_set():
+            deadline += 1
+            now = time.monotonic()
+            if deadline > now:
+                # Wait on the "stopped" event so that "stop" doesn't have to wait for the deadline
+                if self.__stopped.wait(deadline - now):
+                    break
+            else:
+                deadline = now
 
             yield(StreamData("Hello!", timestamp()))
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import cv2
+import numpy as np
 import os
 import pathlib
 
@@ -21,22 +22,41 @@ from darcyai.perceptor.processor import Processor
 from darcyai.input.camera_stream import CameraStream
 from darcyai.output.live_feed_stream import LiveFeedStream
 from darcyai.pipeline import Pipeline
+from darcyai.utils import get_performance_cpus
 
 def perceptor_input_callback(input_data, pom, config):
     return input_data.data
 
 
-def live_feed_callback(pom, input_data):
-    frame = input_data.data.copy()
+# Live feed frames are drawn on a copy of the camera frame that is reused from one pulse to the next
+live_feed_frame = None
+
+
+def copy_to_live_feed_frame(frame):
+    global live_feed_frame
+    if live_feed_frame is None or live_feed_frame.shape != frame.shape:
+        live_feed_frame = np.empty_like(frame)
+    np.copyto(live_feed_frame, frame)
+
+    return live_feed_frame
 
+
+def live_feed_callback(pom, input_data):
     if len(pom.image_classification) == 0:
-        return frame
+        return input_data.data
 
+    frame = copy_to_live_feed_frame(input_data.data)
     cv2.putText(frame, str(pom.image_classification[0].name), (0, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
 
     return frame
 
 
+# Keep the pipeline, and the inference threads of the CPU fallback, on the fastest cores
+# so that inference doesn't land on the little cores of big.LITTLE boards
+performance_cpus = get_performance_cpus()
+if hasattr(os, "sched_setaffinity"):
+    os.sched_setaffinity(0, performance_cpus)
+
 camera = CameraStream(video_device="/dev/video0", fps=20)
 
 pipeline = Pipeline(input_stream=camera)
@@ -45,12 +65,13 @@ live_feed = LiveFeedStream(path="/", port=3456)
 pipeline.add_output_stream("output", live_feed_callback, live_feed)
 
 script_dir = pathlib.Path(__file__).parent.absolute()
+models_dir = script_dir / "models"
 
-coral_model_file = os.path.join(script_dir, "models", "coral_mobilenet_v2_1.0_224_inat_bird_quant_edgetpu.tflite")
-cpu_model_file = os.path.join(script_dir, "models", "cpu_mobilenet_v2_1.0_224_quant.tflite")
+coral_model_file = str(models_dir / "coral_mobilenet_v2_1.0_224_inat_bird_quant_edgetpu.tflite")
+cpu_model_file = str(models_dir / "cpu_mobilenet_v2_1.0_224_quant.tflite")
 
-coral_labels_file = os.path.join(script_dir, "models", "inat_bird_labels.txt")
-cpu_labels_file = os.path.join(script_dir, "models", "cpu_mobilenet_v2_1.0_224_quant_labels.txt")
+coral_labels_file = str(models_dir / "inat_bird_labels.txt")
+cpu_labels_file = str(models_dir / "cpu_mobilenet_v2_1.0_224_quant_labels.txt")
 
 image_classification = ImageClassificationPerceptor(processor_preference={
                                                         Processor.CORAL_EDGE_TPU: {
@@ -65,7 +86,7 @@ image_classification = ImageClassificationPerceptor(processor_preference={
                                                     threshold=0.5,
                                                     top_k=1,
                                                     quantized=True,
-                                                    num_cpu_threads=2)
+                                                    num_cpu_threads=len(performance_cpus))
 
 pipeline.add_perceptor("image_classification", image_classification, input_callback=perceptor_input_callback)
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import cv2
+import numpy as np
 import os
 import pathlib
 
@@ -21,23 +22,49 @@ from darcyai.perceptor.processor import Processor
 from darcyai.input.camera_stream import CameraStream
 from darcyai.output.live_feed_stream import LiveFeedStream
 from darcyai.pipeline import Pipeline
+from darcyai.utils import get_performance_cpus
 
 def perceptor_input_callback(input_data, pom, config):
     return input_data.data
 
 
+# Live feed frames are drawn on a copy of the camera frame that is reused from one pulse to the next
+live_feed_frame = None
+
+
+def copy_to_live_feed_frame(frame):
+    global live_feed_frame
+    if live_feed_frame is None or live_feed_frame.shape != frame.shape:
+        live_feed_frame = np.empty_like(frame)
+    np.copyto(live_feed_frame, frame)
+
+    return live_feed_frame
+
+
 def live_feed_callback(pom, input_data):
-    frame = input_data.data.copy()
-    if pom.object_detection == None:
-        return frame
+    if not pom.object_detection:
+        return input_data.data
+
+    frame = copy_to_live_feed_frame(input_data.data)
+
+    # Draw all the boxes with a single call, one closed 4-point polygon per object
+    boxes = np.array([((object.xmin, object.ymin), (object.xmax, object.ymin),
+                       (object.xmax, object.ymax), (object.xmin, object.ymax))
+                      for object in pom.object_detection], dtype=np.int32)
+    cv2.polylines(frame, boxes, True, (0, 255, 0), 2)
 
     for object in pom.object_detection:
-        cv2.rectangle(frame, (object.xmin, object.ymin), (object.xmax, object.ymax), (0, 255, 0), 2)
         cv2.putText(frame, object.name, (object.xmin, object.ymin - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
 
     return frame
 
 
+# Keep the pipeline, and the inference threads of the CPU fallback, on the fastest cores
+# so that inference doesn't land on the little cores of big.LITTLE boards
+performance_cpus = get_performance_cpus()
+if hasattr(os, "sched_setaffinity"):
+    os.sched_setaffinity(0, performance_cpus)
+
 camera = CameraStream(video_device="/dev/video0", fps=20)
 
 pipeline = Pipeline(input_stream=camera)
@@ -46,12 +73,13 @@ live_feed = LiveFeedStream(path="/", port=3456)
 pipeline.add_output_stream("output", live_feed_callback, live_feed)
 
 script_dir = pathlib.Path(__file__).parent.absolute()
+models_dir = script_dir / "models"
 
-coral_model_file = os.path.join(script_dir, "models", "coral_ssd_mobilenet_v2_coco_quant_postprocess_edgetpu.tflite")
-coral_labels_file = os.path.join(script_dir, "models", "coco_labels.txt")
+coral_model_file = str(models_dir / "coral_ssd_mobilenet_v2_coco_quant_postprocess_edgetpu.tflite")
+coral_labels_file = str(models_dir / "coco_labels.txt")
 
-cpu_model_file = os.path.join(script_dir, "models", "cpu_coco_ssd_mobilenet.tflite")
-cpu_labels_file = os.path.join(script_dir, "models", "coco_labels.txt")
+cpu_model_file = str(models_dir / "cpu_coco_ssd_mobilenet.tflite")
+cpu_labels_file = str(models_dir / "coco_labels.txt")
 
 object_detection = ObjectDetectionPerceptor(processor_preference={
                                                 Processor.CORAL_EDGE_TPU: {
@@ -65,7 +93,7 @@ object_detection = ObjectDetectionPerceptor(processor_preference={
                                             },
                                             threshold=0.5,
                                             quantized=False,
-                                            num_cpu_threads=2)
+                                            num_cpu_threads=len(performance_cpus))
 
 pipeline.add_perceptor("object_detection", object_detection, accelerator_idx=0, input_callback=perceptor_input_callback)
 